@@ -1,18 +1,44 @@
-from typing import Dict
+import sys
+from typing import List, Tuple
 from dndgame.entity import Entity
 from dndgame.races import Race
 from dndgame.weapons import Weapon, get_starting_weapon_for_race
 from dndgame.spells import SpellBook
-from dndgame.dice import roll
+from dndgame.dice import roll_batch
+
+
+def _build_xp_thresholds(levels: int) -> Tuple[int, ...]:
+    """XP needed to leave each level: 100 at level 1, then 1.5x (rounded down) per level."""
+    thresholds = []
+    threshold = 100
+    for _ in range(levels):
+        thresholds.append(threshold)
+        threshold = int(threshold * 1.5)
+    return tuple(thresholds)
+
+
+# XP needed to go from level N to N+1, indexed by N - 1
+_XP_THRESHOLDS: Tuple[int, ...] = _build_xp_thresholds(100)
+
+
+def _next_xp_threshold(level: int, current: int) -> int:
+    """XP needed to leave ``level + 1``, given the ``current`` XP needed to leave ``level``.
+
+    Levels past the end of the table continue its 1.5x chain.
+    """
+    if level < len(_XP_THRESHOLDS):
+        return _XP_THRESHOLDS[level]
+    return int(current * 1.5)
 
 
 class Character(Entity):
     """Represents a player character in the D&D game.
-    
+
     Attributes:
         name: The character's name.
         race: The character's Race object.
         stats: Dictionary mapping stat names to their values.
+        modifiers: Cached ability modifiers for each stat.
         base_hp: Base hit points before Constitution modifier.
         hp: Current hit points.
         max_hp: Maximum hit points.
@@ -22,126 +48,203 @@ class Character(Entity):
         armor_class: Defense rating.
         weapon: Currently equipped weapon.
         spellbook: Known spells.
-        spell_slots: Available spell slots by level.
-        max_spell_slots: Maximum spell slots by level.
+        spell_slots: Available spell slots, indexed by spell level.
+        max_spell_slots: Maximum spell slots, indexed by spell level.
+        active_slot_levels: Spell levels (above cantrips) with any slots at all.
+        stat_block: Stats rendered for display, one "STR: 16 (+3)" line each.
     """
-    
+
+    __slots__ = (
+        "race",
+        "level",
+        "experience",
+        "experience_to_next_level",
+        "spellbook",
+        "spell_slots",
+        "max_spell_slots",
+        "active_slot_levels",
+        "stat_block",
+    )
+
     def __init__(self, name: str, race: Race, base_hp: int) -> None:
         """Initialize a new character.
-        
+
         Args:
             name: The character's name.
             race: The character's Race object.
             base_hp: Base hit points before modifiers.
         """
         super().__init__(name, base_hp)
+        self.stat_block: str = ""
         self.race: Race = race
         self.level: int = 1
         self.experience: int = 0
-        self.experience_to_next_level: int = 100
+        self.experience_to_next_level: int = _XP_THRESHOLDS[0]
         self.weapon: Weapon = get_starting_weapon_for_race(race.name)
         self.spellbook: SpellBook = SpellBook()
-        # Spell slots: {level: current_slots}
-        self.spell_slots: Dict[int, int] = {0: 999, 1: 2, 2: 0}  # Cantrips unlimited
-        self.max_spell_slots: Dict[int, int] = {0: 999, 1: 2, 2: 0}
-    
-    def initialize_stats(self) -> None:
-        """Initialize character stats by rolling and applying racial bonuses."""
-        self.roll_stats()
+        # Spell slots indexed by spell level: [cantrips, level 1, level 2]
+        self.spell_slots: List[int] = [999, 2, 0]  # Cantrips unlimited
+        self.max_spell_slots: List[int] = [999, 2, 0]
+        self.active_slot_levels: Tuple[int, ...] = (1,)
+
+    def recompute_modifiers(self) -> None:
+        """Rebuild the modifier cache and the rendered stat block."""
+        super().recompute_modifiers()
+        modifiers = self.modifiers
+        self.stat_block = "\n".join(
+            f"{stat}: {value} ({modifiers[stat]:+d})"
+            for stat, value in self.stats.items()
+        )
+
+    def initialize_stats(self, verbose: bool = True) -> None:
+        """Initialize character stats by rolling and applying racial bonuses.
+
+        Args:
+            verbose: Whether to print the rolled stats.
+        """
+        self.roll_stats(verbose)
         self.apply_racial_bonuses()
 
-    def roll_stats(self) -> None:
-        """Roll ability scores for the character using 3d6."""
-        print("Rolling stats...\n")
+    def roll_stats(self, verbose: bool = True) -> None:
+        """Roll ability scores for the character using 3d6.
+
+        Args:
+            verbose: Whether to print the rolled stats. Output is written
+                in a single call once all stats are rolled.
+        """
         stats = ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
-        
-        self.stats = {stat: self._roll_single_stat(stat) for stat in stats}
+
+        self.stats = dict(zip(stats, roll_batch(6, 3, len(stats))))
+        if verbose:
+            rolled = "\n".join(
+                f"Rolling {stat}... {value}" for stat, value in self.stats.items()
+            )
+            sys.stdout.write(f"Rolling stats...\n\n{rolled}\n")
 
         self.max_hp = self.base_hp + self.get_modifier("CON")
         self.hp = self.max_hp
-    
-    def _roll_single_stat(self, stat: str) -> int:
-        """Roll a single ability score."""
-        print(f"Rolling {stat}...")
-        return roll(6, 3)
 
     def apply_racial_bonuses(self) -> None:
-        """Apply racial stat bonuses."""
+        """Apply racial stat bonuses.
+
+        Hit points are only recalculated when the race changes CON,
+        since roll_stats has already derived them from the rolled CON.
+        """
         self.race.apply_bonuses(self.stats)
-        
-        self.max_hp = self.base_hp + self.get_modifier("CON")
-        self.hp = self.max_hp
-    
+        self.recompute_modifiers()
+
+        if "CON" in self.race.bonuses:
+            self.max_hp = self.base_hp + self.get_modifier("CON")
+            self.hp = self.max_hp
+
     def equip_weapon(self, weapon: Weapon) -> None:
         """Equip a new weapon."""
         old_weapon = self.weapon.name
         self.weapon = weapon
         print(f"\n{self.name} equipped {weapon.name} (was using {old_weapon})")
-    
+
     def gain_experience(self, amount: int) -> None:
-        """Gain experience points and level up if threshold reached."""
+        """Gain experience points and level up if threshold reached.
+
+        All level-ups earned by a single award are applied together,
+        with one HP roll and one summary.
+
+        Args:
+            amount: Experience points gained.
+        """
         self.experience += amount
-        print(f"\n✨ Gained {amount} XP! (Total: {self.experience}/{self.experience_to_next_level})")
-        
-        while self.experience >= self.experience_to_next_level:
-            self.level_up()
-    
-    def level_up(self) -> None:
-        """Level up the character."""
-        self.level += 1
-        self.experience -= self.experience_to_next_level
-        self.experience_to_next_level = int(self.experience_to_next_level * 1.5)
-        
-        # Roll for HP increase
-        hp_roll = roll(8, 1)
-        hp_gain = hp_roll + self.get_modifier("CON")
-        hp_gain = max(1, hp_gain)
-        
+        print(
+            f"\n✨ Gained {amount} XP! (Total: {self.experience}/{self.experience_to_next_level})"
+        )
+
+        # Count the thresholds crossed before touching state
+        levels_gained = 0
+        remaining = self.experience
+        threshold = self.experience_to_next_level
+        while remaining >= threshold:
+            remaining -= threshold
+            levels_gained += 1
+            threshold = _next_xp_threshold(self.level - 1 + levels_gained, threshold)
+
+        if levels_gained:
+            self.level_up(levels_gained)
+
+    def level_up(self, levels: int = 1) -> None:
+        """Level up the character one or more times.
+
+        Hit points for every level gained are rolled in a single batch
+        of d8s; each level adds its d8 plus the CON modifier, but never
+        less than 1 HP.
+
+        Args:
+            levels: Number of levels to gain (default is 1).
+        """
+        for level in range(self.level, self.level + levels):
+            self.experience -= self.experience_to_next_level
+            self.experience_to_next_level = _next_xp_threshold(
+                level, self.experience_to_next_level
+            )
+        self.level += levels
+
+        # Roll for HP increase: a d8 per level, each worth at least 1 HP
+        con_mod = self.get_modifier("CON")
+        hp_rolls = roll_batch(8, 1, levels)
+        hp_gain = sum(max(1, hp_roll + con_mod) for hp_roll in hp_rolls)
+
         self.max_hp += hp_gain
         self.hp += hp_gain
-        
+
         # Gain spell slots at certain levels
         if self.level >= 3:
             self.max_spell_slots[2] = 2
         if self.level >= 2:
             self.max_spell_slots[1] = 3
-        
-        self.spell_slots = self.max_spell_slots.copy()
-        
+
+        self.spell_slots = self.max_spell_slots[:]
+        self.active_slot_levels = tuple(
+            lvl
+            for lvl in range(1, len(self.max_spell_slots))
+            if self.max_spell_slots[lvl] > 0
+        )
+
         print(f"\n{'='*50}")
         print(f"🎉 LEVEL UP! You are now level {self.level}!")
         print(f"{'='*50}")
+        print(f"🎲 Rolling {levels}d8 for HP: {hp_rolls} ({con_mod:+d} CON each)")
         print(f"💚 HP increased by {hp_gain}! (Now {self.hp}/{self.max_hp})")
         print(f"📈 Next level at {self.experience_to_next_level} XP")
         if self.level >= 2:
             print(f"✨ Spell slots refreshed!")
         print(f"{'='*50}")
-    
+
     def rest(self) -> None:
         """Take a rest to restore HP and spell slots."""
         self.hp = self.max_hp
-        self.spell_slots = self.max_spell_slots.copy()
+        self.spell_slots = self.max_spell_slots[:]
         print(f"\n💤 {self.name} rests and recovers!")
         print(f"💚 HP restored to {self.hp}/{self.max_hp}")
         print(f"✨ Spell slots restored!")
-    
+
     def can_cast(self, spell_level: int) -> bool:
         """Check if character can cast a spell of given level.
-        
+
         Args:
             spell_level: The spell level to check.
-            
+
         Returns:
             True if spell can be cast.
         """
-        return spell_level in self.spell_slots and self.spell_slots[spell_level] > 0
-    
+        return (
+            0 <= spell_level < len(self.spell_slots)
+            and self.spell_slots[spell_level] > 0
+        )
+
     def use_spell_slot(self, spell_level: int) -> bool:
         """Use a spell slot.
-        
+
         Args:
             spell_level: The spell level.
-            
+
         Returns:
             True if slot was available and used.
         """
@@ -149,4 +252,4 @@ class Character(Entity):
             if spell_level > 0:  # Don't reduce cantrip slots
                 self.spell_slots[spell_level] -= 1
             return True
-        return False
\ No newline at end of file
+        return False
@@ -1,3 +1,4 @@
+import heapq
 from typing import List, Optional, TYPE_CHECKING
 from dndgame.entity import Entity
 from dndgame.dice import roll
@@ -8,10 +9,12 @@ if TYPE_CHECKING:
 
 class Combat:
     """Manages combat between entities with optional AI narration."""
-    
-    def __init__(self, *combatants: Entity, dungeon_master: Optional['DungeonMaster'] = None) -> None:
+
+    def __init__(
+        self, *combatants: Entity, dungeon_master: Optional["DungeonMaster"] = None
+    ) -> None:
         """Initialize combat.
-        
+
         Args:
             *combatants: Entities in combat.
             dungeon_master: Optional AI narrator.
@@ -20,62 +23,70 @@ class Combat:
         self.round: int = 0
         self.initiative_order: List[Entity] = []
         self.dm = dungeon_master  # Store the DM
-    
+
     def roll_initiative(self) -> List[Entity]:
-        """Roll initiative to determine turn order."""
-        initiatives = []
-        for combatant in self.combatants:
-            init_roll = roll(20, 1) + combatant.get_modifier("DEX")
-            initiatives.append((init_roll, combatant))
-        
-        initiatives.sort(key=lambda x: x[0], reverse=True)
-        self.initiative_order = [combatant for _, combatant in initiatives]
-        
+        """Roll initiative to determine turn order.
+
+        Ties keep the order in which combatants joined the fight.
+        """
+        initiatives = [
+            (roll(20, 1) + combatant.dex_mod, -index, combatant)
+            for index, combatant in enumerate(self.combatants)
+        ]
+        self.initiative_order = [
+            combatant
+            for _, _, combatant in heapq.nlargest(len(initiatives), initiatives)
+        ]
+
         return self.initiative_order
 
     def attack(self, attacker: Entity, defender: Entity) -> int:
         """Execute an attack with optional AI narration."""
-        attack_roll: int = roll(20, 1) + attacker.get_modifier("STR")
-        
-        if attack_roll >= defender.armor_class:
-            weapon = attacker.weapon
-            
-            weapon_damage = 0
-            for _ in range(weapon.damage_count):
-                weapon_damage += roll(weapon.damage_dice, 1)
-            
-            damage: int = weapon_damage + attacker.get_modifier("STR") + weapon.damage_bonus
+        armor_class = defender.armor_class
+        weapon = attacker.weapon
+        str_mod = attacker.str_mod
+        attack_roll: int = roll(20, 1) + str_mod
+
+        if attack_roll >= armor_class:
+            weapon_damage = roll(weapon.damage_dice, weapon.damage_count)
+
+            damage: int = weapon_damage + str_mod + weapon.damage_bonus
             damage = max(1, damage)
             defender.take_damage(damage)
-            
-            # AI narration for hit
+
+            # AI narration for hit, printed when it arrives
             if self.dm:
-                narration = self.dm.narrate_attack(
+                self.dm.narrate_attack_async(
                     attacker.name,
                     defender.name,
                     weapon.name,
                     damage,
-                    is_critical=(attack_roll == 20)
+                    is_critical=(attack_roll == 20),
                 )
-                if narration:
-                    print(f"\n📖 {narration}")
-            
+
             return damage
         else:
-            # AI narration for miss
+            # AI narration for miss, printed when it arrives
             if self.dm:
-                narration = self.dm.narrate_miss(attacker.name, defender.name)
-                if narration:
-                    print(f"\n📖 {narration}")
-            
+                self.dm.narrate_miss_async(attacker.name, defender.name)
+
             return 0
-    
+
+    def _living_combatants(self, limit: int) -> List[Entity]:
+        """Collect living combatants, stopping once ``limit`` are found."""
+        alive: List[Entity] = []
+        for combatant in self.combatants:
+            if combatant.is_alive():
+                alive.append(combatant)
+                if len(alive) == limit:
+                    break
+        return alive
+
     def is_combat_over(self) -> bool:
         """Check if combat has ended."""
-        alive_combatants = [c for c in self.combatants if c.is_alive()]
-        return len(alive_combatants) <= 1
-    
+        return len(self._living_combatants(2)) <= 1
+
     def get_winner(self) -> Entity | None:
         """Get the winner of combat."""
-        alive = [c for c in self.combatants if c.is_alive()]
-        return alive[0] if len(alive) == 1 else None
\ No newline at end of file
+        alive = self._living_combatants(2)
+        return alive[0] if len(alive) == 1 else None
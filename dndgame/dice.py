@@ -1,14 +1,26 @@
 import random
 
 
+def set_seed(seed: int) -> None:
+    """Seed the shared random generator so rolls are reproducible.
+
+    Args:
+        seed: Seed value for the generator.
+    """
+    random.seed(seed)
+
+
 def roll(dice_type: int, number_of_dice: int) -> int:
     """Roll dice and return sum."""
-    rolls = []
-    total = 0
-    for _ in range(number_of_dice):
-        roll_result = random.randint(1, dice_type)
-        rolls.append(roll_result)
-        total += roll_result
+    if number_of_dice == 1:
+        # Single die (attack rolls, initiative): no list to build or sum
+        result = random.randint(1, dice_type)
+        print(f"Rolling 1d{dice_type}: [{result}] = {result}")
+        return result
+
+    randint = random.randint  # Look up once per call, not per die
+    rolls = [randint(1, dice_type) for _ in range(number_of_dice)]
+    total = sum(rolls)
     print(f"Rolling {number_of_dice}d{dice_type}: {rolls} = {total}")
     return total
 
@@ -25,3 +37,34 @@ def roll_with_disadvantage(dice_type: int) -> int:
     roll1 = roll(dice_type, 1)
     roll2 = roll(dice_type, 1)
     return min(roll1, roll2)
+
+
+def roll_batch(dice_type: int, number_of_dice: int, groups: int) -> list[int]:
+    """Roll several groups of dice with a single random draw.
+
+    Draws one integer uniformly from [0, dice_type ** (number_of_dice * groups))
+    and reads each die face off as a base-``dice_type`` digit, so rolling
+    six 3d6 ability scores costs one RNG call instead of eighteen.
+
+    Args:
+        dice_type: Number of sides on each die.
+        number_of_dice: Dice summed per group (e.g., 3 for 3d6).
+        groups: Number of group totals to return.
+
+    Returns:
+        List of ``groups`` totals, each the sum of ``number_of_dice`` dice.
+
+    Example:
+        >>> set_seed(42)
+        >>> roll_batch(6, 3, 6)  # six 3d6 ability scores
+        [9, 12, 18, 5, 14, 11]
+    """
+    draw = random.randrange(dice_type ** (number_of_dice * groups))
+    totals = []
+    for _ in range(groups):
+        total = number_of_dice
+        for _ in range(number_of_dice):
+            draw, face = divmod(draw, dice_type)
+            total += face
+        totals.append(total)
+    return totals
@@ -1,209 +1,418 @@
 import os
-from typing import Optional
-from openai import OpenAI
-from dotenv import load_dotenv
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from openai import OpenAI
+    from openai.types.chat import ChatCompletionSystemMessageParam
+
+
+_MODEL = "gpt-4o-mini"
+
+# Remembered narrations: a few lines per scenario, for at most this many scenarios
+_LINES_PER_SCENARIO = 3
+_MAX_SCENARIOS = 256
+
+# System messages are constant per narration type, so the request prefix
+# stays byte-identical between calls.
+_ATTACK_SYSTEM: "ChatCompletionSystemMessageParam" = {
+    "role": "system",
+    "content": "You are an epic Dungeon Master narrating D&D combat. Be dramatic and concise.",
+}
+_MISS_SYSTEM: "ChatCompletionSystemMessageParam" = {
+    "role": "system",
+    "content": "You are a Dungeon Master narrating combat. Be concise and dramatic.",
+}
+_SPELL_SYSTEM: "ChatCompletionSystemMessageParam" = {
+    "role": "system",
+    "content": "You are a Dungeon Master narrating magical spells. Be vivid and dramatic.",
+}
+_DEATH_SYSTEM: "ChatCompletionSystemMessageParam" = {
+    "role": "system",
+    "content": "You are a Dungeon Master narrating epic D&D moments.",
+}
+
+_ATTACK_PROMPT = """You are a Dungeon Master narrating a D&D combat scene. 
+Narrate this attack in 1-2 dramatic sentences. Be vivid and exciting!
+
+Attacker: {attacker}
+Defender: {defender}
+Weapon: {weapon}
+Damage: {damage}
+Type: {hit_type}
+
+Keep it under 50 words. Make it feel epic!"""
+
+_MISS_PROMPT = """You are a Dungeon Master narrating a D&D combat miss. 
+Describe how {attacker} misses their attack against {defender} in 1 sentence. 
+Make it dramatic but brief (under 30 words)."""
+
+_SPELL_PROMPT = """You are a Dungeon Master narrating a D&D spell. 
+Describe {caster} casting {spell} on {target} in 1-2 dramatic sentences.
+The spell {effect}.
+Make it magical and vivid! Keep it under 50 words."""
+
+_DEATH_PROMPT = """You are a Dungeon Master narrating a character's death in D&D. 
+{character} has been slain by {killer}. 
+Describe their final moments dramatically in 1-2 sentences. 
+Keep it under 50 words, and make it epic but not overly gory."""
 
 
 class DungeonMaster:
     """AI-powered Dungeon Master that narrates the game.
-    
+
     Uses OpenAI's API to generate dramatic narration for combat
     events, making each battle unique and engaging.
-    
+
+    Background narrations, and any notes about failed requests, are only
+    printed by flush_narrations(), on the caller's thread and in the
+    order they were requested.
+
+    Up to three narrations are remembered per scenario. Once a scenario
+    has all of them, repeated attacks and misses rotate through those
+    lines instead of calling the API.
+
     Attributes:
         client: OpenAI API client.
         enabled: Whether AI narration is enabled.
     """
-    
-    client: Optional[OpenAI]
+
+    client: Optional["OpenAI"]
     enabled: bool
-    
-    def __init__(self) -> None:
-        """Initialize the Dungeon Master."""
-        api_key = os.getenv("OPENAI_API_KEY")
-        self.enabled = api_key is not None and api_key != ""
-        
-        if self.enabled:
-            self.client = OpenAI(api_key=api_key)
+    _pool: Optional[ThreadPoolExecutor]
+    _pending: Deque[Tuple["Future[Optional[str]]", List[str]]]
+    _worker_state: threading.local
+    _cache: Dict[Tuple[Hashable, ...], Deque[str]]
+    _cache_lock: threading.Lock
+
+    def __init__(self, client: Optional["OpenAI"] = None) -> None:
+        """Initialize the Dungeon Master.
+
+        The OpenAI client library is only imported when an API key is
+        configured, so classic mode doesn't pay for loading it.
+
+        Args:
+            client: Chat client to narrate with. If omitted, one is built
+                from OPENAI_API_KEY, and narration is disabled without a key.
+        """
+        if client is None:
+            from dotenv import load_dotenv
+
+            # Load environment variables
+            load_dotenv()
+            api_key = os.getenv("OPENAI_API_KEY")
+            if api_key:
+                from openai import OpenAI
+
+                client = OpenAI(api_key=api_key)
+
+        self.client = client
+        self.enabled = client is not None
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._pending = deque()
+        self._worker_state = threading.local()
+        self._pool = ThreadPoolExecutor(max_workers=2) if self.enabled else None
+
+    def _narrate_in_background(
+        self, narrate: Callable[..., Optional[str]], *args: Any, **kwargs: Any
+    ) -> Optional["Future[Optional[str]]"]:
+        """Run a narration method on the worker pool.
+
+        The result and any DM notes are queued rather than printed, so they
+        can't land in the middle of other output; flush_narrations() prints
+        them.
+
+        Args:
+            narrate: The narration method to run.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            A Future for the narration, or None if AI is disabled.
+        """
+        if not self.enabled or self._pool is None:
+            return None
+
+        notes: List[str] = []
+        future = self._pool.submit(self._collect_notes, notes, narrate, *args, **kwargs)
+        self._pending.append((future, notes))
+        return future
+
+    def _collect_notes(
+        self,
+        notes: List[str],
+        narrate: Callable[..., Optional[str]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """Run a narration on a worker thread, collecting its DM notes in ``notes``."""
+        self._worker_state.notes = notes
+        try:
+            return narrate(*args, **kwargs)
+        finally:
+            self._worker_state.notes = None
+
+    def _note(self, message: str) -> None:
+        """Print a DM note, or hold it for flush_narrations() on a worker thread."""
+        notes = getattr(self._worker_state, "notes", None)
+        if notes is None:
+            print(message)
         else:
-            self.client = None
-    
-    def narrate_attack(
+            notes.append(message)
+
+    def flush_narrations(self, wait: bool = True) -> None:
+        """Print queued background narrations in the order they were requested.
+
+        Args:
+            wait: Whether to wait for narrations still in flight. Without
+                waiting, only the finished ones at the front of the queue
+                are printed, so a turn never stalls on the API; wait before
+                moments the narration must precede, like a death, and when
+                combat ends.
+        """
+        pending = self._pending
+        while pending and (wait or pending[0][0].done()):
+            future, notes = pending.popleft()
+            narration = future.result()
+            for note in notes:
+                print(note)
+            if narration:
+                print(f"\n📖 {narration}")
+
+    def narrate_attack_async(
         self,
         attacker_name: str,
         defender_name: str,
         weapon_name: str,
         damage: int,
-        is_critical: bool = False
-    ) -> Optional[str]:
-        """Narrate an attack with AI.
-        
+        is_critical: bool = False,
+    ) -> Optional["Future[Optional[str]]"]:
+        """Narrate an attack without waiting for the API.
+
+        Combat can carry on while the request is in flight; the narration
+        is printed by a later flush_narrations() call.
+
         Args:
             attacker_name: Name of the attacker.
             defender_name: Name of the defender.
             weapon_name: Name of the weapon used.
             damage: Amount of damage dealt.
             is_critical: Whether this was a critical hit.
-            
+
         Returns:
-            AI-generated narration, or None if AI is disabled.
+            A Future for the narration, or None if AI is disabled.
         """
-        if not self.enabled or not self.client:
-            return None
-        
-        try:
-            hit_type = "critical hit" if is_critical else "hit"
-            
-            prompt = f"""You are a Dungeon Master narrating a D&D combat scene. 
-Narrate this attack in 1-2 dramatic sentences. Be vivid and exciting!
+        return self._narrate_in_background(
+            self.narrate_attack,
+            attacker_name,
+            defender_name,
+            weapon_name,
+            damage,
+            is_critical=is_critical,
+        )
 
-Attacker: {attacker_name}
-Defender: {defender_name}
-Weapon: {weapon_name}
-Damage: {damage}
-Type: {hit_type}
+    def narrate_miss_async(
+        self, attacker_name: str, defender_name: str
+    ) -> Optional["Future[Optional[str]]"]:
+        """Narrate a missed attack without waiting for the API.
 
-Keep it under 50 words. Make it feel epic!"""
+        Args:
+            attacker_name: Name of the attacker.
+            defender_name: Name of the defender.
+
+        Returns:
+            A Future for the narration, or None if AI is disabled.
+        """
+        return self._narrate_in_background(
+            self.narrate_miss, attacker_name, defender_name
+        )
+
+    def clear_cache(self) -> None:
+        """Forget all remembered narrations."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _complete_cached(
+        self,
+        key: Tuple[Hashable, ...],
+        system_message: "ChatCompletionSystemMessageParam",
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> Optional[str]:
+        """Return a narration for ``key``, requesting new ones until enough are remembered.
+
+        The first few narrations of a scenario each come from the API;
+        after that the remembered lines are reused in rotation. Only
+        successful narrations are remembered, and the scenario used least
+        recently is forgotten once too many are stored.
+
+        Args:
+            key: Scenario the narration describes.
+            system_message: The shared system message for this narration type.
+            prompt: The filled-in user prompt.
+            max_tokens: Maximum length of the reply.
+            temperature: Sampling temperature.
 
+        Returns:
+            AI-generated narration, or None if AI is disabled or the call
+            fails with nothing remembered for this scenario.
+        """
+        with self._cache_lock:
+            lines = self._cache.get(key)
+            is_full = lines is not None and len(lines) >= _LINES_PER_SCENARIO
+
+        if not is_full:
+            narration = self._complete(system_message, prompt, max_tokens, temperature)
+            if narration is not None:
+                with self._cache_lock:
+                    lines = self._cache.pop(key, None)
+                    if lines is None:
+                        lines = deque(maxlen=_LINES_PER_SCENARIO)
+                    lines.append(narration)
+                    self._cache[key] = lines
+                    if len(self._cache) > _MAX_SCENARIOS:
+                        del self._cache[next(iter(self._cache))]
+                return narration
+
+        with self._cache_lock:
+            lines = self._cache.pop(key, None)
+            if not lines:
+                return None
+            # Reinsert to mark the scenario as recently used, then take the next line
+            self._cache[key] = lines
+            lines.rotate(-1)
+            return lines[-1]
+
+    def _complete(
+        self,
+        system_message: "ChatCompletionSystemMessageParam",
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> Optional[str]:
+        """Send one narration request to the API.
+
+        Args:
+            system_message: The shared system message for this narration type.
+            prompt: The filled-in user prompt.
+            max_tokens: Maximum length of the reply.
+            temperature: Sampling temperature.
+
+        Returns:
+            AI-generated narration, or None if AI is disabled or the call fails.
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        try:
             response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an epic Dungeon Master narrating D&D combat. Be dramatic and concise."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=100,
-                temperature=0.8
+                model=_MODEL,
+                messages=[system_message, {"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
             )
-            
+
             narration = response.choices[0].message.content
             return narration.strip() if narration else None
-            
+
         except Exception as e:
-            print(f"[DM Note: AI narration unavailable - {e}]")
+            self._note(f"[DM Note: AI narration unavailable - {e}]")
             return None
-    
-    def narrate_miss(
+
+    def narrate_attack(
         self,
         attacker_name: str,
-        defender_name: str
+        defender_name: str,
+        weapon_name: str,
+        damage: int,
+        is_critical: bool = False,
     ) -> Optional[str]:
+        """Narrate an attack with AI.
+
+        Args:
+            attacker_name: Name of the attacker.
+            defender_name: Name of the defender.
+            weapon_name: Name of the weapon used.
+            damage: Amount of damage dealt.
+            is_critical: Whether this was a critical hit.
+
+        Returns:
+            AI-generated narration, or None if AI is disabled.
+        """
+        key = ("attack", attacker_name, defender_name, weapon_name, damage, is_critical)
+        hit_type = "critical hit" if is_critical else "hit"
+        prompt = _ATTACK_PROMPT.format(
+            attacker=attacker_name,
+            defender=defender_name,
+            weapon=weapon_name,
+            damage=damage,
+            hit_type=hit_type,
+        )
+        return self._complete_cached(
+            key, _ATTACK_SYSTEM, prompt, max_tokens=100, temperature=0.8
+        )
+
+    def narrate_miss(self, attacker_name: str, defender_name: str) -> Optional[str]:
         """Narrate a missed attack.
-        
+
         Args:
             attacker_name: Name of the attacker.
             defender_name: Name of the defender.
-            
+
         Returns:
             AI-generated narration, or None if AI is disabled.
         """
-        if not self.enabled or not self.client:
-            return None
-        
-        try:
-            prompt = f"""You are a Dungeon Master narrating a D&D combat miss. 
-Describe how {attacker_name} misses their attack against {defender_name} in 1 sentence. 
-Make it dramatic but brief (under 30 words)."""
+        prompt = _MISS_PROMPT.format(attacker=attacker_name, defender=defender_name)
+        return self._complete_cached(
+            ("miss", attacker_name, defender_name),
+            _MISS_SYSTEM,
+            prompt,
+            max_tokens=60,
+            temperature=0.8,
+        )
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a Dungeon Master narrating combat. Be concise and dramatic."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=60,
-                temperature=0.8
-            )
-            
-            narration = response.choices[0].message.content
-            return narration.strip() if narration else None
-            
-        except Exception as e:
-            print(f"[DM Note: AI narration unavailable - {e}]")
-            return None
-    
     def narrate_spell_cast(
-        self,
-        caster_name: str,
-        spell_name: str,
-        target_name: str,
-        effect: str
+        self, caster_name: str, spell_name: str, target_name: str, effect: str
     ) -> Optional[str]:
         """Narrate a spell being cast.
-        
+
         Args:
             caster_name: Name of the caster.
             spell_name: Name of the spell.
             target_name: Name of the target.
             effect: Description of the effect (e.g., "deals 8 damage", "heals 5 HP").
-            
+
         Returns:
             AI-generated narration, or None if AI is disabled.
         """
-        if not self.enabled or not self.client:
-            return None
-        
-        try:
-            prompt = f"""You are a Dungeon Master narrating a D&D spell. 
-Describe {caster_name} casting {spell_name} on {target_name} in 1-2 dramatic sentences.
-The spell {effect}.
-Make it magical and vivid! Keep it under 50 words."""
+        prompt = _SPELL_PROMPT.format(
+            caster=caster_name, spell=spell_name, target=target_name, effect=effect
+        )
+        return self._complete(_SPELL_SYSTEM, prompt, max_tokens=100, temperature=0.9)
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a Dungeon Master narrating magical spells. Be vivid and dramatic."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=100,
-                temperature=0.9
-            )
-            
-            narration = response.choices[0].message.content
-            return narration.strip() if narration else None
-            
-        except Exception as e:
-            print(f"[DM Note: AI narration unavailable - {e}]")
-            return None
-    
-    def narrate_death(
-        self,
-        character_name: str,
-        killer_name: str
-    ) -> Optional[str]:
+    def narrate_death(self, character_name: str, killer_name: str) -> Optional[str]:
         """Narrate a character's death.
-        
+
         Args:
             character_name: Name of the character who died.
             killer_name: Name of the killer.
-            
+
         Returns:
             AI-generated narration, or None if AI is disabled.
         """
-        if not self.enabled or not self.client:
-            return None
-        
-        try:
-            prompt = f"""You are a Dungeon Master narrating a character's death in D&D. 
-{character_name} has been slain by {killer_name}. 
-Describe their final moments dramatically in 1-2 sentences. 
-Keep it under 50 words, and make it epic but not overly gory."""
-
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a Dungeon Master narrating epic D&D moments."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=100,
-                temperature=0.8
-            )
-            
-            narration = response.choices[0].message.content
-            return narration.strip() if narration else None
-            
-        except Exception as e:
-            print(f"[DM Note: AI narration unavailable - {e}]")
-            return None
\ No newline at end of file
+        prompt = _DEATH_PROMPT.format(character=character_name, killer=killer_name)
+        return self._complete(_DEATH_SYSTEM, prompt, max_tokens=100, temperature=0.8)
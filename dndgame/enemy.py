@@ -5,11 +5,11 @@ from dndgame.weapons import Weapon, WEAPONS
 
 class Enemy(Entity):
     """Represents an enemy in combat.
-    
+
     Enemies have pre-defined stats rather than rolled stats, and
     include a challenge rating for difficulty assessment. Unlike
     player characters, enemies don't have races or level up.
-    
+
     Attributes:
         name: The enemy's name.
         enemy_type: Type of enemy (e.g., "Goblin", "Orc").
@@ -20,7 +20,7 @@ class Enemy(Entity):
         challenge_rating: Difficulty rating (0.25 = easy, 1+ = harder).
         weapon: The enemy's equipped weapon.
         xp_value: Experience points awarded for defeating this enemy.
-    
+
     Example:
         >>> goblin = Enemy(
         ...     name="Goblin Scout",
@@ -34,20 +34,22 @@ class Enemy(Entity):
         >>> print(goblin.name)
         Goblin Scout
     """
-    
+
+    __slots__ = ("enemy_type", "challenge_rating", "xp_value")
+
     def __init__(
-        self, 
-        name: str, 
-        enemy_type: str, 
-        stats: Dict[str, int], 
+        self,
+        name: str,
+        enemy_type: str,
+        stats: Dict[str, int],
         hp: int,
         armor_class: int = 10,
         challenge_rating: float = 0.5,
         weapon: Weapon | None = None,
-        xp_value: int = 25
+        xp_value: int = 25,
     ) -> None:
         """Initialize an enemy.
-        
+
         Args:
             name: The enemy's name.
             enemy_type: Type of enemy (e.g., "Goblin", "Orc").
@@ -67,10 +69,10 @@ class Enemy(Entity):
         self.armor_class = armor_class
         self.weapon: Weapon = weapon if weapon else WEAPONS["Unarmed"]
         self.xp_value: int = xp_value
-    
+
     def initialize_stats(self) -> None:
         """Enemies have pre-defined stats, so this is a no-op.
-        
+
         This method is required by the Entity base class but does
         nothing for enemies since their stats are set in __init__.
         """
@@ -79,17 +81,17 @@ class Enemy(Entity):
 
 def create_goblin(name: str = "Goblin") -> Enemy:
     """Factory function to create a standard goblin enemy.
-    
+
     Creates a goblin with typical stats: low strength, high dexterity,
     average constitution. Goblins are nimble but weak creatures armed
     with shortswords. Worth 50 XP when defeated.
-    
+
     Args:
         name: Name for this specific goblin (default is "Goblin").
-        
+
     Returns:
         A Goblin enemy with standard stats.
-        
+
     Example:
         >>> goblin = create_goblin("Sneaky Pete")
         >>> print(goblin.name)
@@ -103,16 +105,16 @@ def create_goblin(name: str = "Goblin") -> Enemy:
         name=name,
         enemy_type="Goblin",
         stats={
-            "STR": 8,   # -1 modifier (weak)
+            "STR": 8,  # -1 modifier (weak)
             "DEX": 14,  # +2 modifier (nimble)
             "CON": 10,  # +0 modifier (average)
             "INT": 10,  # +0 modifier (average)
-            "WIS": 8,   # -1 modifier (poor perception)
-            "CHA": 8    # -1 modifier (unfriendly)
+            "WIS": 8,  # -1 modifier (poor perception)
+            "CHA": 8,  # -1 modifier (unfriendly)
         },
         hp=7,
         armor_class=13,  # Leather armor + DEX
         challenge_rating=0.25,  # Easy enemy
         weapon=WEAPONS["Shortsword"],
-        xp_value=50  # XP reward
-    )
\ No newline at end of file
+        xp_value=50,  # XP reward
+    )
@@ -1,42 +1,80 @@
-from typing import Dict, TYPE_CHECKING
-from abc import ABC, abstractmethod
+from typing import Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from dndgame.weapons import Weapon
 
 
-class Entity(ABC):
+# Ability modifier for every legal score 0-50, indexed by the score itself
+_MOD_TABLE: Tuple[int, ...] = tuple((score - 10) // 2 for score in range(51))
+
+
+def _modifier(score: int) -> int:
+    """Ability modifier for any score, using the table for the usual 0-50 range."""
+    if 0 <= score < len(_MOD_TABLE):
+        return _MOD_TABLE[score]
+    return (score - 10) // 2
+
+
+class Entity:
     """Base class for all combat entities (characters and enemies).
-    
+
     An entity represents any creature that can participate in combat.
     It has ability scores, hit points, an armor class, and can wield weapons.
-    The abstract initialize_stats method must be implemented by subclasses to 
+    The initialize_stats method must be implemented by subclasses to
     define how each entity type sets up its stats.
-    
+
     Attributes:
         name: The entity's name.
         stats: Dictionary of ability scores (STR, DEX, CON, INT, WIS, CHA).
+        modifiers: Ability modifiers cached from stats whenever stats is
+            assigned; call recompute_modifiers() after editing stats in place.
+        str_mod, dex_mod, con_mod, int_mod, wis_mod, cha_mod: The cached
+            modifiers as plain attributes (0 for a stat that isn't set).
         hp: Current hit points.
         max_hp: Maximum hit points.
         armor_class: Defense rating (higher is better).
         base_hp: Base hit points before modifiers.
         weapon: The entity's equipped weapon (set by subclasses).
-    
+
     Example:
         >>> class Goblin(Entity):
         ...     def initialize_stats(self):
         ...         self.stats = {"STR": 8, "DEX": 14, "CON": 10, ...}
     """
-    
+
+    __slots__ = (
+        "name",
+        "_stats",
+        "modifiers",
+        "str_mod",
+        "dex_mod",
+        "con_mod",
+        "int_mod",
+        "wis_mod",
+        "cha_mod",
+        "hp",
+        "max_hp",
+        "armor_class",
+        "base_hp",
+        "weapon",
+    )
+
     def __init__(self, name: str, base_hp: int) -> None:
         """Initialize an entity.
-        
+
         Args:
             name: The entity's name.
             base_hp: Base hit points before modifiers.
         """
         self.name: str = name
-        self.stats: Dict[str, int] = {}
+        self._stats: Dict[str, int] = {}
+        self.modifiers: Dict[str, int] = {}
+        self.str_mod: int = 0
+        self.dex_mod: int = 0
+        self.con_mod: int = 0
+        self.int_mod: int = 0
+        self.wis_mod: int = 0
+        self.cha_mod: int = 0
         self.hp: int = 0
         self.max_hp: int = 0
         self.armor_class: int = 10
@@ -46,44 +84,78 @@ class Entity(ABC):
         # to avoid circular import issues
         if TYPE_CHECKING:
             self.weapon: Weapon
-    
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The entity's ability scores.
+
+        Assigning a new dict refreshes the cached modifiers. Changing the
+        dict in place (e.g. ``entity.stats["STR"] = 18``) does not: until
+        recompute_modifiers() is called, get_modifier() and the ``*_mod``
+        attributes still report the old values.
+        """
+        return self._stats
+
+    @stats.setter
+    def stats(self, value: Dict[str, int]) -> None:
+        """Replace the ability scores and refresh the cached modifiers."""
+        self._stats = value
+        self.recompute_modifiers()
+
+    def recompute_modifiers(self) -> None:
+        """Rebuild the modifier cache from the current stats.
+
+        Must be called after stats are changed in place (e.g., by
+        racial bonuses); assigning a new stats dict does it automatically.
+        """
+        modifiers = {stat: _modifier(value) for stat, value in self._stats.items()}
+        self.modifiers = modifiers
+        self.str_mod = modifiers.get("STR", 0)
+        self.dex_mod = modifiers.get("DEX", 0)
+        self.con_mod = modifiers.get("CON", 0)
+        self.int_mod = modifiers.get("INT", 0)
+        self.wis_mod = modifiers.get("WIS", 0)
+        self.cha_mod = modifiers.get("CHA", 0)
+
     def get_modifier(self, stat: str) -> int:
         """Calculate the ability modifier for a given stat.
-        
+
         In D&D, ability modifiers are calculated as (stat - 10) // 2.
-        For example, a stat of 16 gives a modifier of +3.
-        
+        For example, a stat of 16 gives a modifier of +3. The values
+        for scores 0-50 come from a precomputed table and are
+        cached when stats is assigned, so after changing stats in place
+        call recompute_modifiers() first.
+
         Args:
             stat: The stat name (e.g., "STR", "DEX", "CON").
-            
+
         Returns:
             The modifier value (can be negative, zero, or positive).
-            
+
         Example:
-            >>> entity.stats["STR"] = 16
+            >>> entity.stats = {"STR": 16}
             >>> entity.get_modifier("STR")
             3
         """
-        return (self.stats[stat] - 10) // 2
-    
-    @abstractmethod
+        return self.modifiers[stat]
+
     def initialize_stats(self) -> None:
         """Initialize entity stats. Must be implemented by subclasses.
-        
+
         This method should set up the entity's stats dictionary and
         calculate hit points based on those stats.
-        
+
         Raises:
             NotImplementedError: If not implemented by subclass.
         """
-        pass
-    
+        raise NotImplementedError
+
     def is_alive(self) -> bool:
         """Check if the entity is still alive.
-        
+
         Returns:
             True if the entity has more than 0 hit points, False otherwise.
-            
+
         Example:
             >>> entity.hp = 5
             >>> entity.is_alive()
@@ -93,16 +165,16 @@ class Entity(ABC):
             False
         """
         return self.hp > 0
-    
+
     def take_damage(self, damage: int) -> None:
         """Reduce HP by the specified damage amount.
-        
+
         HP cannot go below 0. If damage would reduce HP below 0,
         HP is set to exactly 0.
-        
+
         Args:
             damage: The amount of damage to take.
-            
+
         Example:
             >>> entity.hp = 10
             >>> entity.take_damage(3)
@@ -112,4 +184,4 @@ class Entity(ABC):
             >>> entity.hp
             0
         """
-        self.hp = max(0, self.hp - damage)
\ No newline at end of file
+        self.hp = max(0, self.hp - damage)
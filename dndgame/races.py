@@ -1,43 +1,49 @@
-from typing import Dict
-from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 
-class Race(ABC):
+class Race:
     """Base class for character races.
 
     A race defines the inherent traits and bonuses that a character
     receives based on their ancestry. Each race provides ability score
-    bonuses that make them naturally better at certain tasks.
+    bonuses that make them naturally better at certain tasks. The
+    bonuses are plain data, so a new race only needs to declare them.
 
     Attributes:
         name: The race name (e.g., "Human", "Elf").
         description: Brief description of racial bonuses.
+        bonuses: Mapping of stat name to the bonus added to it.
 
     Example:
         >>> class Orc(Race):
         ...     def __init__(self):
-        ...         super().__init__("Orc", "+2 STR, +1 CON")
-        ...     def apply_bonuses(self, stats):
-        ...         stats["STR"] += 2
-        ...         stats["CON"] += 1
+        ...         super().__init__("Orc", "+2 STR, +1 CON", {"STR": 2, "CON": 1})
     """
 
-    def __init__(self, name: str, description: str) -> None:
+    def __init__(self, name: str, description: str, bonuses: Mapping[str, int]) -> None:
         """Initialize a race.
 
         Args:
             name: The race name.
             description: Brief description of racial bonuses.
+            bonuses: Mapping of stat name to the bonus added to it. It is
+                copied into a read-only view, since race instances are shared.
         """
         self.name: str = name
         self.description: str = description
+        self.bonuses: Mapping[str, int] = MappingProxyType(dict(bonuses))
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "Race":
+        """Share the race instead of copying it; races are read-only."""
+        return self
 
-    @abstractmethod
     def apply_bonuses(self, stats: Dict[str, int]) -> None:
         """Apply racial stat bonuses to a character's stats.
 
         This method modifies the stats dictionary in-place, adding
-        the racial bonuses appropriate for this race.
+        the racial bonuses appropriate for this race. Stats missing
+        from the dictionary are left out rather than added.
 
         Args:
             stats: Character stats dictionary to modify.
@@ -49,7 +55,9 @@ class Race(ABC):
             >>> print(stats["STR"])  # Now 11
             11
         """
-        pass
+        for stat, bonus in self.bonuses.items():
+            if stat in stats:
+                stats[stat] += bonus
 
 
 class Human(Race):
@@ -64,16 +72,11 @@ class Human(Race):
 
     def __init__(self) -> None:
         """Initialize a Human race."""
-        super().__init__("Human", "+1 to all stats")
-
-    def apply_bonuses(self, stats: Dict[str, int]) -> None:
-        """Apply +1 to all ability scores.
-
-        Args:
-            stats: Character stats to modify.
-        """
-        for stat in stats:
-            stats[stat] += 1
+        super().__init__(
+            "Human",
+            "+1 to all stats",
+            {"STR": 1, "DEX": 1, "CON": 1, "INT": 1, "WIS": 1, "CHA": 1},
+        )
 
 
 class Elf(Race):
@@ -87,15 +90,7 @@ class Elf(Race):
 
     def __init__(self) -> None:
         """Initialize an Elf race."""
-        super().__init__("Elf", "+2 DEX")
-
-    def apply_bonuses(self, stats: Dict[str, int]) -> None:
-        """Apply +2 to Dexterity.
-
-        Args:
-            stats: Character stats to modify.
-        """
-        stats["DEX"] += 2
+        super().__init__("Elf", "+2 DEX", {"DEX": 2})
 
 
 class Dwarf(Race):
@@ -110,15 +105,7 @@ class Dwarf(Race):
 
     def __init__(self) -> None:
         """Initialize a Dwarf race."""
-        super().__init__("Dwarf", "+2 CON")
-
-    def apply_bonuses(self, stats: Dict[str, int]) -> None:
-        """Apply +2 to Constitution.
-
-        Args:
-            stats: Character stats to modify.
-        """
-        stats["CON"] += 2
+        super().__init__("Dwarf", "+2 CON", {"CON": 2})
 
 
 class Halfling(Race):
@@ -133,25 +120,18 @@ class Halfling(Race):
 
     def __init__(self) -> None:
         """Initialize a Halfling race."""
-        super().__init__("Halfling", "+2 DEX, +1 CHA")
-
-    def apply_bonuses(self, stats: Dict[str, int]) -> None:
-        """Apply +2 to Dexterity and +1 to Charisma.
-
-        Args:
-            stats: Character stats to modify.
-        """
-        stats["DEX"] += 2
-        stats["CHA"] += 1
-
-
-# Race registry - all available races
-AVAILABLE_RACES: Dict[str, Race] = {
-    "Human": Human(),
-    "Elf": Elf(),
-    "Dwarf": Dwarf(),
-    "Halfling": Halfling(),
-}
+        super().__init__("Halfling", "+2 DEX, +1 CHA", {"DEX": 2, "CHA": 1})
+
+
+# Race registry - all available races (read-only, one shared instance per race)
+AVAILABLE_RACES: Mapping[str, Race] = MappingProxyType(
+    {
+        "Human": Human(),
+        "Elf": Elf(),
+        "Dwarf": Dwarf(),
+        "Halfling": Halfling(),
+    }
+)
 
 
 def get_race(race_name: str) -> Race:
@@ -1,3 +1,4 @@
+import bisect
 from typing import Dict
 from abc import ABC, abstractmethod
 from dndgame.entity import Entity
@@ -6,17 +7,20 @@ from dndgame.dice import roll
 
 class Spell(ABC):
     """Base class for all spells.
-    
+
     Attributes:
         name: The spell's name.
         level: Spell level (0-9, where 0 is a cantrip).
         school: School of magic (e.g., "Evocation", "Abjuration").
         description: Brief description of spell effect.
+        spell_kind: What the spell does, "damage" or "heal".
     """
-    
+
+    spell_kind: str = "damage"
+
     def __init__(self, name: str, level: int, school: str, description: str) -> None:
         """Initialize a spell.
-        
+
         Args:
             name: The spell's name.
             level: Spell level (0-9).
@@ -27,15 +31,15 @@ class Spell(ABC):
         self.level: int = level
         self.school: str = school
         self.description: str = description
-    
+
     @abstractmethod
     def cast(self, caster: Entity, target: Entity) -> str:
         """Cast the spell.
-        
+
         Args:
             caster: The entity casting the spell.
             target: The entity being targeted.
-            
+
         Returns:
             String describing the spell's effect.
         """
@@ -44,12 +48,12 @@ class Spell(ABC):
 
 class DamageSpell(Spell):
     """A spell that deals damage to a target.
-    
+
     Attributes:
         damage_dice: Number of sides on damage die.
         damage_count: Number of dice to roll.
     """
-    
+
     def __init__(
         self,
         name: str,
@@ -57,10 +61,10 @@ class DamageSpell(Spell):
         school: str,
         description: str,
         damage_dice: int,
-        damage_count: int
+        damage_count: int,
     ) -> None:
         """Initialize a damage spell.
-        
+
         Args:
             name: Spell name.
             level: Spell level.
@@ -72,40 +76,40 @@ class DamageSpell(Spell):
         super().__init__(name, level, school, description)
         self.damage_dice: int = damage_dice
         self.damage_count: int = damage_count
-    
+
     def cast(self, caster: Entity, target: Entity) -> str:
         """Cast a damage spell on the target.
-        
+
         Args:
             caster: The caster.
             target: The target to damage.
-            
+
         Returns:
             Description of the effect.
         """
-        # Roll damage
-        total_damage = 0
-        for _ in range(self.damage_count):
-            total_damage += roll(self.damage_dice, 1)
-        
+        # Roll all damage dice at once
+        total_damage = roll(self.damage_dice, self.damage_count)
+
         # Add caster's INT modifier for spell damage
-        spell_bonus = caster.get_modifier("INT")
+        spell_bonus = caster.int_mod
         total_damage += spell_bonus
         total_damage = max(1, total_damage)  # Minimum 1 damage
-        
+
         target.take_damage(total_damage)
-        
+
         return f"💫 {caster.name} casts {self.name}! {target.name} takes {total_damage} damage!"
 
 
 class HealingSpell(Spell):
     """A spell that heals a target.
-    
+
     Attributes:
         healing_dice: Number of sides on healing die.
         healing_count: Number of dice to roll.
     """
-    
+
+    spell_kind = "heal"
+
     def __init__(
         self,
         name: str,
@@ -113,10 +117,10 @@ class HealingSpell(Spell):
         school: str,
         description: str,
         healing_dice: int,
-        healing_count: int
+        healing_count: int,
     ) -> None:
         """Initialize a healing spell.
-        
+
         Args:
             name: Spell name.
             level: Spell level.
@@ -128,45 +132,40 @@ class HealingSpell(Spell):
         super().__init__(name, level, school, description)
         self.healing_dice: int = healing_dice
         self.healing_count: int = healing_count
-    
+
     def cast(self, caster: Entity, target: Entity) -> str:
         """Cast a healing spell on the target.
-        
+
         Args:
             caster: The caster.
             target: The target to heal.
-            
+
         Returns:
             Description of the effect.
         """
-        # Roll healing
-        total_healing = 0
-        for _ in range(self.healing_count):
-            total_healing += roll(self.healing_dice, 1)
-        
+        # Roll all healing dice at once
+        total_healing = roll(self.healing_dice, self.healing_count)
+
         # Add caster's INT modifier for spell healing
-        spell_bonus = caster.get_modifier("INT")
+        spell_bonus = caster.int_mod
         total_healing += spell_bonus
         total_healing = max(1, total_healing)  # Minimum 1 healing
-        
+
         # Heal target (don't exceed max HP)
         old_hp = target.hp
         target.hp = min(target.max_hp, target.hp + total_healing)
         actual_healing = target.hp - old_hp
-        
+
         return f"✨ {caster.name} casts {self.name}! {target.name} recovers {actual_healing} HP!"
 
 
 # Spell catalog - all available spells
 SPELLS: Dict[str, Spell] = {
     # Cantrips (Level 0) - unlimited use
-    "Fire Bolt": DamageSpell(
-        "Fire Bolt", 0, "Evocation", "A mote of fire", 10, 1
-    ),
+    "Fire Bolt": DamageSpell("Fire Bolt", 0, "Evocation", "A mote of fire", 10, 1),
     "Ray of Frost": DamageSpell(
         "Ray of Frost", 0, "Evocation", "A beam of freezing energy", 8, 1
     ),
-    
     # Level 1 Spells
     "Magic Missile": DamageSpell(
         "Magic Missile", 1, "Evocation", "Three darts of magical force", 4, 3
@@ -177,7 +176,6 @@ SPELLS: Dict[str, Spell] = {
     "Cure Wounds": HealingSpell(
         "Cure Wounds", 1, "Evocation", "Touch to heal wounds", 8, 1
     ),
-    
     # Level 2 Spells
     "Scorching Ray": DamageSpell(
         "Scorching Ray", 2, "Evocation", "Three rays of fire", 6, 2
@@ -190,59 +188,80 @@ SPELLS: Dict[str, Spell] = {
 
 class SpellBook:
     """A collection of spells known by a character.
-    
+
+    Spells are kept sorted by level (in the order learned within a
+    level), so level queries can binary-search instead of scanning.
+    Menus that list the spellbook therefore show spells by level,
+    not in the order they were learned.
+
     Attributes:
-        spells: List of Spell objects in the spellbook.
+        spells: Read-only tuple of the known spells, ordered by level.
+            Use add_spell() to learn new ones.
     """
-    
+
     def __init__(self) -> None:
         """Initialize an empty spellbook."""
-        self.spells: list[Spell] = []
+        self._spells: tuple[Spell, ...] = ()
+        # Levels of self._spells, kept in step for bisect lookups
+        self._levels: list[int] = []
+        # Known spells, for constant-time duplicate checks
+        self._spell_set: set[Spell] = set()
+
+    @property
+    def spells(self) -> tuple[Spell, ...]:
+        """The known spells, ordered by level."""
+        return self._spells
 
     def add_spell(self, spell: Spell) -> None:
         """Add a spell to the spellbook.
-        
+
         Args:
             spell: The spell to add.
         """
-        if spell not in self.spells:
-            self.spells.append(spell)
+        if spell not in self._spell_set:
+            self._spell_set.add(spell)
+            index = bisect.bisect_right(self._levels, spell.level)
+            self._levels.insert(index, spell.level)
+            spells = self._spells
+            self._spells = spells[:index] + (spell,) + spells[index:]
 
     def get_spells_by_level(self, spell_level: int) -> list[Spell]:
         """Get spells of a specific level.
-        
+
         Args:
             spell_level: The spell level to filter by.
-            
+
         Returns:
             List of spells at that level.
         """
-        return list(filter(lambda s: s.level == spell_level, self.spells))
-    
+        levels = self._levels
+        start = bisect.bisect_left(levels, spell_level)
+        return list(
+            self._spells[start : bisect.bisect_right(levels, spell_level, start)]
+        )
+
     def get_available_spells(self, spell_level: int) -> list[Spell]:
         """Get spells available at or below a given spell level.
-        
-        Uses functional programming with filter() instead of loops.
-        
+
         Args:
             spell_level: Maximum spell level to include.
-            
+
         Returns:
             List of spells with level <= spell_level.
         """
-        return list(filter(lambda spell: spell.level <= spell_level, self.spells))
+        return list(self._spells[: bisect.bisect_right(self._levels, spell_level)])
 
 
 def get_spell(spell_name: str) -> Spell:
     """Get a spell by name from the catalog.
-    
+
     Args:
         spell_name: Name of the spell.
-        
+
     Returns:
         The Spell object.
-        
+
     Raises:
         KeyError: If spell not found.
     """
-    return SPELLS[spell_name]
\ No newline at end of file
+    return SPELLS[spell_name]
@@ -1,131 +1,145 @@
 from typing import Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntFlag
 
 
-@dataclass
+class WeaponProperty(IntFlag):
+    """Special weapon properties, combined as bit flags.
+
+    Example:
+        >>> props = WeaponProperty.FINESSE | WeaponProperty.LIGHT
+        >>> bool(props & WeaponProperty.FINESSE)
+        True
+    """
+
+    FINESSE = 1
+    LIGHT = 2
+    VERSATILE = 4
+    TWO_HANDED = 8
+    HEAVY = 16
+
+
+@dataclass(slots=True, frozen=True)
 class Weapon:
     """Represents a weapon with damage properties.
-    
+
     Weapons define the damage dice used in combat and any special
-    properties that affect how they're used.
-    
+    properties that affect how they're used. Weapons are immutable, so
+    catalog entries can be shared safely between characters.
+
     Attributes:
         name: The weapon's name.
         damage_dice: Number of sides on the damage die (e.g., 6 for 1d6).
         damage_count: Number of dice to roll (e.g., 2 for 2d6).
         damage_bonus: Fixed damage bonus added to rolls.
-        properties: Special weapon properties (e.g., finesse, two_handed).
-    
+        properties: Special weapon properties as WeaponProperty flags.
+
     Example:
         >>> longsword = Weapon("Longsword", 8, 1)
         >>> print(f"{longsword.name} deals {longsword.damage_count}d{longsword.damage_dice}")
         Longsword deals 1d8
     """
+
     name: str
     damage_dice: int
     damage_count: int = 1
     damage_bonus: int = 0
-    properties: Dict[str, bool] | None = None
-    
+    properties: WeaponProperty = WeaponProperty(0)
+    _damage_desc: str = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        """Initialize properties dict if not provided."""
-        if self.properties is None:
-            self.properties = {}
-    
+        """Build the damage description once, since weapons never change."""
+        desc = f"{self.damage_count}d{self.damage_dice}"
+        if self.damage_bonus > 0:
+            desc += f"+{self.damage_bonus}"
+        object.__setattr__(self, "_damage_desc", desc)
+
     def get_damage_description(self) -> str:
         """Get a description of the weapon's damage.
-        
+
         Returns:
             String describing damage (e.g., "1d8", "2d6+2").
-            
+
         Example:
             >>> weapon = Weapon("Greatsword", 6, 2)
             >>> weapon.get_damage_description()
             '2d6'
         """
-        desc = f"{self.damage_count}d{self.damage_dice}"
-        if self.damage_bonus > 0:
-            desc += f"+{self.damage_bonus}"
-        return desc
+        return self._damage_desc
 
 
 # Weapon catalog - all available weapons
 WEAPONS: Dict[str, Weapon] = {
-    "Unarmed": Weapon(
-        name="Unarmed Strike",
-        damage_dice=4,
-        damage_count=1,
-        properties={}
-    ),
+    "Unarmed": Weapon(name="Unarmed Strike", damage_dice=4, damage_count=1),
     "Dagger": Weapon(
         name="Dagger",
         damage_dice=4,
         damage_count=1,
-        properties={"finesse": True, "light": True}
+        properties=WeaponProperty.FINESSE | WeaponProperty.LIGHT,
     ),
     "Shortsword": Weapon(
         name="Shortsword",
         damage_dice=6,
         damage_count=1,
-        properties={"finesse": True, "light": True}
+        properties=WeaponProperty.FINESSE | WeaponProperty.LIGHT,
     ),
     "Longsword": Weapon(
         name="Longsword",
         damage_dice=8,
         damage_count=1,
-        properties={"versatile": True}
+        properties=WeaponProperty.VERSATILE,
     ),
     "Greatsword": Weapon(
         name="Greatsword",
         damage_dice=6,
         damage_count=2,
-        properties={"two_handed": True, "heavy": True}
+        properties=WeaponProperty.TWO_HANDED | WeaponProperty.HEAVY,
     ),
     "Battleaxe": Weapon(
         name="Battleaxe",
         damage_dice=8,
         damage_count=1,
-        properties={"versatile": True}
+        properties=WeaponProperty.VERSATILE,
     ),
     "Greataxe": Weapon(
         name="Greataxe",
         damage_dice=12,
         damage_count=1,
-        properties={"two_handed": True, "heavy": True}
-    ),
-    "Mace": Weapon(
-        name="Mace",
-        damage_dice=6,
-        damage_count=1,
-        properties={}
+        properties=WeaponProperty.TWO_HANDED | WeaponProperty.HEAVY,
     ),
+    "Mace": Weapon(name="Mace", damage_dice=6, damage_count=1),
     "Rapier": Weapon(
-        name="Rapier",
-        damage_dice=8,
-        damage_count=1,
-        properties={"finesse": True}
+        name="Rapier", damage_dice=8, damage_count=1, properties=WeaponProperty.FINESSE
     ),
     "Warhammer": Weapon(
         name="Warhammer",
         damage_dice=8,
         damage_count=1,
-        properties={"versatile": True}
+        properties=WeaponProperty.VERSATILE,
     ),
 }
 
+# Starting weapon for each race; other races start unarmed
+_STARTING_WEAPONS: Dict[str, Weapon] = {
+    "Human": WEAPONS["Longsword"],
+    "Elf": WEAPONS["Shortsword"],
+    "Dwarf": WEAPONS["Battleaxe"],
+    "Halfling": WEAPONS["Dagger"],
+}
+
 
 def get_weapon(weapon_name: str) -> Weapon:
     """Get a weapon by name from the catalog.
-    
+
     Args:
         weapon_name: Name of the weapon to retrieve.
-        
+
     Returns:
         The Weapon object.
-        
+
     Raises:
         KeyError: If weapon name not found.
-        
+
     Example:
         >>> longsword = get_weapon("Longsword")
         >>> print(longsword.name)
@@ -136,22 +150,16 @@ def get_weapon(weapon_name: str) -> Weapon:
 
 def get_starting_weapon_for_race(race_name: str) -> Weapon:
     """Get a starting weapon appropriate for a character's race.
-    
+
     Args:
         race_name: The character's race name.
-        
+
     Returns:
         An appropriate starting weapon.
-        
+
     Example:
         >>> weapon = get_starting_weapon_for_race("Elf")
         >>> print(weapon.name)
         Shortsword
     """
-    starting_weapons = {
-        "Human": WEAPONS["Longsword"],
-        "Elf": WEAPONS["Shortsword"],
-        "Dwarf": WEAPONS["Battleaxe"],
-        "Halfling": WEAPONS["Dagger"],
-    }
-    return starting_weapons.get(race_name, WEAPONS["Unarmed"])
\ No newline at end of file
+    return _STARTING_WEAPONS.get(race_name, WEAPONS["Unarmed"])
@@ -1,83 +1,185 @@
+import sys
+from functools import partial
+
 from dndgame.character import Character
-from dndgame.enemy import create_goblin, Enemy
-from dndgame.combat import Combat
 from dndgame.races import AVAILABLE_RACES
-from dndgame.weapons import WEAPONS
-from dndgame.spells import SPELLS, HealingSpell
+from dndgame.weapons import WEAPONS, Weapon, WeaponProperty
+from dndgame.spells import SPELLS
 from dndgame.entity import Entity
 from dndgame.dungeon_master import DungeonMaster
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dndgame.combat import Combat
+    from dndgame.enemy import Enemy
+
+
+# Cosmetic round banners are only drawn for a real terminal, so piped or
+# scripted sessions don't spend time rendering them; game state always prints
+_INTERACTIVE = sys.stdout.isatty()
+
+_DIV = "=" * 50
+_NL_DIV = "\n" + _DIV
+
+# Catalog names in menu order; the catalogs don't change while the game runs
+_RACE_NAMES = tuple(AVAILABLE_RACES)
+_WEAPON_NAMES = tuple(WEAPONS)
+_SPELL_NAMES = tuple(SPELLS)
+
+
+def _weapon_menu_line(number: int, weapon: Weapon) -> str:
+    """Format one numbered entry of the weapon menu."""
+    finesse = " (Finesse)" if weapon.properties & WeaponProperty.FINESSE else ""
+    two_handed = (
+        " (Two-Handed)" if weapon.properties & WeaponProperty.TWO_HANDED else ""
+    )
+    return f"{number}. {weapon.name} - {weapon.get_damage_description()}{finesse}{two_handed}"
+
+
+# Selection menus, formatted once since the catalogs are static
+_RACE_MENU = "\n".join(
+    f"{i}. {name} ({AVAILABLE_RACES[name].description})"
+    for i, name in enumerate(_RACE_NAMES, 1)
+)
+_WEAPON_MENU = "\n".join(
+    _weapon_menu_line(i, WEAPONS[name]) for i, name in enumerate(_WEAPON_NAMES, 1)
+)
+_SPELL_MENU = "\n".join(
+    f"{i}. {spell.name} (Level {spell.level}) - {spell.description}"
+    for i, spell in enumerate((SPELLS[name] for name in _SPELL_NAMES), 1)
+)
+
+_MENU_TEXT = "\n".join(
+    [
+        _NL_DIV,
+        "What would you like to do?",
+        _DIV,
+        "1. Fight a goblin",
+        "2. View character",
+        "3. Change weapon",
+        "4. Rest (restore HP and spells)",
+        "5. Quit",
+    ]
+)
+
+_COMBAT_CHOICES = frozenset("123")
+# Character sheet layout; display_character fills it and writes it in one call
+_SHEET_TEMPLATE = (
+    "\n%(name)s the %(race)s\n"
+    "📊 Level: %(level)d\n"
+    "✨ XP: %(xp)d/%(xp_next)d\n"
+    "\n⚔️  Weapon: %(weapon)s (%(damage)s)\n"
+    "\n🔮 Known Spells:\n%(spells)s\n"
+    "\n✨ Spell Slots:%(slots)s\n"
+    "\nStats:\n%(stats)s\n"
+    "\n💚 HP: %(hp)d/%(max_hp)d\n"
+)
+
+_TURN_MENU = "\nYour turn!\n1. Attack with weapon\n2. Cast spell\n3. Run away"
+
+# Fixed combat messages; lines with per-turn values stay as f-strings
+_GOBLIN_DEFEATED = "The goblin has been defeated!"
+_PLAYER_MISSED = "\n❌ You missed!"
+
+
+def _read_choice(prompt: str, lo: int, hi: int) -> int:
+    """Prompt until the player enters a whole number from lo to hi.
+
+    Args:
+        prompt: Text shown when asking for input.
+        lo: Smallest accepted number.
+        hi: Largest accepted number.
+
+    Returns:
+        The chosen number.
+    """
+    while True:
+        try:
+            choice = int(input(prompt))
+        except ValueError:
+            pass
+        else:
+            if lo <= choice <= hi:
+                return choice
+        print(f"Invalid choice! Please enter {lo}-{hi}.")
+
+
+def _read_spell_pair(hi: int) -> Tuple[int, int]:
+    """Prompt until the player enters two different spell numbers on one line.
+
+    The numbers may be separated by spaces or a comma (e.g. "1 3" or "1,3").
+
+    Args:
+        hi: Largest accepted spell number.
+
+    Returns:
+        The two chosen numbers, in the order entered.
+    """
+    while True:
+        parts = (
+            input(f"\nChoose 2 spells, e.g. '1 3' (1-{hi}): ").replace(",", " ").split()
+        )
+        try:
+            first, second = (int(part) for part in parts)
+        except ValueError:
+            pass
+        else:
+            if first != second and 1 <= first <= hi and 1 <= second <= hi:
+                return first, second
+        print(f"Invalid choice! Please enter two different numbers from 1-{hi}.")
 
 
 def create_character() -> Character:
     """Create a new character through user input."""
     print("Welcome to D&D Adventure!")
-    
+
     name = input("Enter your character's name: ").strip()
     while not name:
         print("Name cannot be empty!")
         name = input("Enter your character's name: ").strip()
 
     print("\nChoose your race:")
-    races = list(AVAILABLE_RACES.keys())
-    for i, race_name in enumerate(races, 1):
-        race = AVAILABLE_RACES[race_name]
-        print(f"{i}. {race_name} ({race.description})")
-    
-    while True:
-        race_choice = input(f"Enter choice (1-{len(races)}): ").strip()
-        if race_choice.isdigit() and 1 <= int(race_choice) <= len(races):
-            break
-        print(f"Invalid choice! Please enter 1-{len(races)}.")
-    
+    races = _RACE_NAMES
+    print(_RACE_MENU)
+
+    race_choice = _read_choice(f"Enter choice (1-{len(races)}): ", 1, len(races))
+
     print("\n")
-    selected_race = AVAILABLE_RACES[races[int(race_choice) - 1]]
-    
+    selected_race = AVAILABLE_RACES[races[race_choice - 1]]
+
     character = Character(name, selected_race, 10)
     character.initialize_stats()
-    
-    print(f"\n⚔️  Starting weapon: {character.weapon.name} ({character.weapon.get_damage_description()})")
-    
+
+    print(
+        f"\n⚔️  Starting weapon: {character.weapon.name} ({character.weapon.get_damage_description()})"
+    )
+
     print("\n🔮 Choose 2 starting spells:")
-    spell_list = list(SPELLS.keys())
-    for i, spell_name in enumerate(spell_list, 1):
-        spell = SPELLS[spell_name]
-        print(f"{i}. {spell.name} (Level {spell.level}) - {spell.description}")
-    
-    spells_chosen = 0
-    while spells_chosen < 2:
-        choice = input(f"\nChoose spell {spells_chosen + 1} (1-{len(spell_list)}): ").strip()
-        if choice.isdigit() and 1 <= int(choice) <= len(spell_list):
-            spell = SPELLS[spell_list[int(choice) - 1]]
-            character.spellbook.add_spell(spell)
-            print(f"✨ Learned {spell.name}!")
-            spells_chosen += 1
-        else:
-            print(f"Invalid choice! Please enter 1-{len(spell_list)}.")
-    
+    spell_list = _SPELL_NAMES
+    print(_SPELL_MENU)
+
+    for choice in _read_spell_pair(len(spell_list)):
+        spell = SPELLS[spell_list[choice - 1]]
+        character.spellbook.add_spell(spell)
+        print(f"✨ Learned {spell.name}!")
+
     return character
 
 
 def choose_weapon(character: Character) -> None:
     """Allow player to choose a different weapon."""
-    print("\n" + "="*50)
+    print(_NL_DIV)
     print("Available Weapons:")
-    print("="*50)
-    
-    weapons_list = list(WEAPONS.keys())
-    for i, weapon_name in enumerate(weapons_list, 1):
-        weapon = WEAPONS[weapon_name]
-        finesse = " (Finesse)" if weapon.properties and weapon.properties.get("finesse") else ""
-        two_handed = " (Two-Handed)" if weapon.properties and weapon.properties.get("two_handed") else ""
-        print(f"{i}. {weapon.name} - {weapon.get_damage_description()}{finesse}{two_handed}")
-    
-    while True:
-        choice = input(f"\nChoose weapon (1-{len(weapons_list)}) or 0 to cancel: ").strip()
-        if choice.isdigit() and 0 <= int(choice) <= len(weapons_list):
-            break
-        print(f"Invalid choice! Please enter 0-{len(weapons_list)}.")
-    
-    choice_num = int(choice)
+    print(_DIV)
+
+    weapons_list = _WEAPON_NAMES
+    print(_WEAPON_MENU)
+
+    choice_num = _read_choice(
+        f"\nChoose weapon (1-{len(weapons_list)}) or 0 to cancel: ",
+        0,
+        len(weapons_list),
+    )
     if choice_num > 0:
         selected_weapon = WEAPONS[weapons_list[choice_num - 1]]
         character.equip_weapon(selected_weapon)
@@ -85,160 +187,317 @@ def choose_weapon(character: Character) -> None:
 
 def display_character(character: Character) -> None:
     """Display character information."""
-    print(f"\n{character.name} the {character.race.name}")
-    print(f"📊 Level: {character.level}")
-    print(f"✨ XP: {character.experience}/{character.experience_to_next_level}")
-    print(f"\n⚔️  Weapon: {character.weapon.name} ({character.weapon.get_damage_description()})")
-    
-    print("\n🔮 Known Spells:")
-    if character.spellbook.spells:
-        for spell in character.spellbook.spells:
-            print(f"  - {spell.name} (Level {spell.level}): {spell.description}")
+    weapon = character.weapon
+    spells = character.spellbook.spells
+
+    sys.stdout.write(
+        _SHEET_TEMPLATE
+        % {
+            "name": character.name,
+            "race": character.race.name,
+            "level": character.level,
+            "xp": character.experience,
+            "xp_next": character.experience_to_next_level,
+            "weapon": weapon.name,
+            "damage": weapon.get_damage_description(),
+            "spells": (
+                "\n".join(
+                    f"  - {spell.name} (Level {spell.level}): {spell.description}"
+                    for spell in spells
+                )
+                if spells
+                else "  None"
+            ),
+            "slots": "".join(
+                f"\n  Level {level}: {character.spell_slots[level]}/{character.max_spell_slots[level]}"
+                for level in character.active_slot_levels
+            ),
+            "stats": character.stat_block,
+            "hp": character.hp,
+            "max_hp": character.max_hp,
+        }
+    )
+
+
+def _flush_narrations(combat: "Combat", wait: bool = True) -> None:
+    """Print the DM's background narrations so far, if there is a DM.
+
+    Turns pass ``wait=False`` so they only print narrations that have
+    already arrived; deaths and the end of combat wait for the rest.
+    """
+    if combat.dm:
+        combat.dm.flush_narrations(wait)
+
+
+def _player_turn(
+    player: Character, goblin: "Enemy", combat: "Combat"
+) -> Optional[bool]:
+    """Play the player's turn.
+
+    Args:
+        player: The player taking the turn.
+        goblin: The enemy the player is fighting.
+        combat: The running combat.
+
+    Returns:
+        False if the player fled, otherwise None to carry on with combat.
+    """
+    _flush_narrations(combat, wait=False)
+    weapon_name = player.weapon.name
+
+    # Build the whole status block and emit it in one write before prompting
+    lines = [
+        f"\n{player.name}'s HP: {player.hp}/{player.max_hp}",
+        f"Goblin HP: {goblin.hp}/{goblin.max_hp}",
+        f"⚔️  Your weapon: {weapon_name} ({player.weapon.get_damage_description()})",
+    ]
+
+    available_slots = [
+        f"L{lvl}:{player.spell_slots[lvl]}" for lvl in player.active_slot_levels
+    ]
+    if available_slots:
+        lines.append(f"✨ Spell slots: {', '.join(available_slots)}")
+
+    lines.append(_TURN_MENU)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    while True:
+        choice = input("\nWhat do you do? ").strip()
+        if choice in _COMBAT_CHOICES:
+            break
+        print("Invalid choice! Please enter 1, 2, or 3.")
+
+    if choice == "3":
+        print(f"\n{player.name} flees from combat!")
+        return False
+    elif choice == "1":
+        damage = combat.attack(player, goblin)
+        if damage > 0:
+            print(
+                f"\n💥 You hit the goblin with your {weapon_name} for {damage} damage!"
+            )
+            if not goblin.is_alive():
+                _flush_narrations(combat)
+                print(_GOBLIN_DEFEATED)
+                if combat.dm:
+                    death_narration = combat.dm.narrate_death(goblin.name, player.name)
+                    if death_narration:
+                        print(f"\n📖 {death_narration}")
+        else:
+            print(_PLAYER_MISSED)
+    elif choice == "2":
+        if not player.spellbook.spells:
+            print("You don't know any spells!")
+            return None
+
+        print("\nChoose a spell:")
+        for i, spell in enumerate(player.spellbook.spells, 1):
+            can_cast = player.can_cast(spell.level)
+            status = "✓" if can_cast else "✗"
+            spell_type = "Heal" if spell.spell_kind == "heal" else "Damage"
+            print(f"{i}. [{status}] {spell.name} (Level {spell.level}) - {spell_type}")
+
+        spell_choice = input(
+            f"\nCast which spell (1-{len(player.spellbook.spells)}) or 0 to cancel? "
+        ).strip()
+        if spell_choice == "0":
+            return None
+
+        if spell_choice.isdigit() and 1 <= int(spell_choice) <= len(
+            player.spellbook.spells
+        ):
+            spell = player.spellbook.spells[int(spell_choice) - 1]
+            if player.use_spell_slot(spell.level):
+                if spell.spell_kind == "heal":
+                    target: Entity = player
+                else:
+                    target = goblin
+
+                result = spell.cast(player, target)
+                print(f"\n{result}")
+
+                if combat.dm:
+                    if spell.spell_kind == "heal":
+                        effect = f"heals {player.name}"
+                    else:
+                        effect = "deals damage"
+                    spell_narration = combat.dm.narrate_spell_cast(
+                        player.name, spell.name, target.name, effect
+                    )
+                    if spell_narration:
+                        print(f"\n📖 {spell_narration}")
+
+                if not goblin.is_alive():
+                    _flush_narrations(combat)
+                    print(_GOBLIN_DEFEATED)
+                    if combat.dm:
+                        death_narration = combat.dm.narrate_death(
+                            goblin.name, player.name
+                        )
+                        if death_narration:
+                            print(f"\n📖 {death_narration}")
+            else:
+                print(f"\n❌ No spell slots available for level {spell.level}!")
+        else:
+            print("Invalid choice!")
+    return None
+
+
+def _enemy_turn(
+    enemy: Entity, player: Character, combat: "Combat", lines: Tuple[str, str, str]
+) -> Optional[bool]:
+    """Play an enemy's turn against the player.
+
+    Args:
+        enemy: The attacking enemy.
+        player: The player being attacked.
+        combat: The running combat.
+        lines: The enemy's prebuilt turn banner, hit prefix and miss line.
+
+    Returns:
+        False if the player was defeated, otherwise None to carry on with combat.
+    """
+    turn_banner, hit_prefix, miss_line = lines
+    _flush_narrations(combat, wait=False)
+    print(turn_banner)
+    damage = combat.attack(enemy, player)
+    if damage > 0:
+        print(f"{hit_prefix}{damage} damage!")
+        if not player.is_alive():
+            _flush_narrations(combat)
+            print(f"\n💀 You have been defeated by the {enemy.name}!")
+            if combat.dm:
+                death_narration = combat.dm.narrate_death(player.name, enemy.name)
+                if death_narration:
+                    print(f"\n📖 {death_narration}")
+            return False
     else:
-        print("  None")
-    
-    print("\n✨ Spell Slots:")
-    for level, slots in character.spell_slots.items():
-        if level > 0 and character.max_spell_slots[level] > 0:
-            print(f"  Level {level}: {slots}/{character.max_spell_slots[level]}")
-    
-    print("\nStats:")
-    for stat, value in character.stats.items():
-        modifier = character.get_modifier(stat)
-        print(f"{stat}: {value} ({'+' if modifier >= 0 else ''}{modifier})")
-    print(f"\n💚 HP: {character.hp}/{character.max_hp}")
+        print(miss_line)
+    return None
 
 
 def combat_encounter(player: Character, dm: Optional[DungeonMaster] = None) -> bool:
-    """Run a combat encounter with optional AI narration."""
-    print("\n" + "="*50)
+    """Run a combat encounter with optional AI narration.
+
+    The combat and enemy modules are imported here, on the first fight,
+    so sessions that never fight don't load them.
+    """
+    from dndgame.combat import Combat
+    from dndgame.enemy import create_goblin
+
+    print(_NL_DIV)
     print("A goblin appears!")
-    print("="*50)
-    
-    goblin: Enemy = create_goblin()
+    print(_DIV)
+
+    goblin: "Enemy" = create_goblin()
     combat = Combat(player, goblin, dungeon_master=dm)
     combat.roll_initiative()
-    
-    print(f"\nInitiative order: {[c.name for c in combat.initiative_order]}")
-    
+
+    initiative_names = ", ".join(c.name for c in combat.initiative_order)
+    print(f"\nInitiative order: {initiative_names}")
+
+    # Each combatant's turn, bound to its opponent once per encounter. Enemy
+    # turn lines only depend on the enemy, so they're rendered once per
+    # encounter here instead of on every turn
+    turns: Dict[Entity, Callable[["Combat"], Optional[bool]]] = {
+        c: partial(
+            _enemy_turn,
+            c,
+            player,
+            lines=(
+                f"\n🗡️  {c.name}'s turn!",
+                f"💥 The {c.name} hits you with their {c.weapon.name} for ",
+                f"❌ The {c.name} missed!",
+            ),
+        )
+        for c in combat.initiative_order
+        if c is not player
+    }
+    turns[player] = partial(_player_turn, player, goblin)
+
+    round_num = combat.round
     while not combat.is_combat_over():
-        combat.round += 1
-        print(f"\n{'='*50}")
-        print(f"--- Round {combat.round} ---")
-        print(f"{'='*50}")
-        
+        round_num += 1
+        if _INTERACTIVE:
+            sys.stdout.write(f"{_NL_DIV}\n--- Round {round_num} ---\n{_DIV}\n")
+
         for combatant in combat.initiative_order:
             if not combatant.is_alive():
                 continue
-            
-            if combatant == player:
-                print(f"\n{player.name}'s HP: {player.hp}/{player.max_hp}")
-                print(f"Goblin HP: {goblin.hp}/{goblin.max_hp}")
-                print(f"⚔️  Your weapon: {player.weapon.name} ({player.weapon.get_damage_description()})")
-                
-                available_slots = [f"L{lvl}:{slots}" for lvl, slots in player.spell_slots.items() 
-                                 if lvl > 0 and player.max_spell_slots[lvl] > 0]
-                if available_slots:
-                    print(f"✨ Spell slots: {', '.join(available_slots)}")
-                
-                print("\nYour turn!")
-                print("1. Attack with weapon")
-                print("2. Cast spell")
-                print("3. Run away")
-                
-                while True:
-                    choice = input("\nWhat do you do? ").strip()
-                    if choice in ["1", "2", "3"]:
-                        break
-                    print("Invalid choice! Please enter 1, 2, or 3.")
-                
-                if choice == "3":
-                    print(f"\n{player.name} flees from combat!")
-                    return False
-                elif choice == "1":
-                    damage = combat.attack(player, goblin)
-                    if damage > 0:
-                        print(f"\n💥 You hit the goblin with your {player.weapon.name} for {damage} damage!")
-                        if not goblin.is_alive():
-                            print(f"The goblin has been defeated!")
-                            if dm:
-                                death_narration = dm.narrate_death(goblin.name, player.name)
-                                if death_narration:
-                                    print(f"\n📖 {death_narration}")
-                    else:
-                        print(f"\n❌ You missed!")
-                elif choice == "2":
-                    if not player.spellbook.spells:
-                        print("You don't know any spells!")
-                        continue
-                    
-                    print("\nChoose a spell:")
-                    for i, spell in enumerate(player.spellbook.spells, 1):
-                        can_cast = player.can_cast(spell.level)
-                        status = "✓" if can_cast else "✗"
-                        spell_type = "Heal" if isinstance(spell, HealingSpell) else "Damage"
-                        print(f"{i}. [{status}] {spell.name} (Level {spell.level}) - {spell_type}")
-                    
-                    spell_choice = input(f"\nCast which spell (1-{len(player.spellbook.spells)}) or 0 to cancel? ").strip()
-                    if spell_choice == "0":
-                        continue
-                    
-                    if spell_choice.isdigit() and 1 <= int(spell_choice) <= len(player.spellbook.spells):
-                        spell = player.spellbook.spells[int(spell_choice) - 1]
-                        if player.use_spell_slot(spell.level):
-                            if isinstance(spell, HealingSpell):
-                                target: Entity = player
-                            else:
-                                target = goblin
-                            
-                            result = spell.cast(player, target)
-                            print(f"\n{result}")
-                            
-                            if dm:
-                                if isinstance(spell, HealingSpell):
-                                    effect = f"heals {player.name}"
-                                else:
-                                    effect = "deals damage"
-                                spell_narration = dm.narrate_spell_cast(
-                                    player.name, spell.name, target.name, effect
-                                )
-                                if spell_narration:
-                                    print(f"\n📖 {spell_narration}")
-                            
-                            if not goblin.is_alive():
-                                print(f"The goblin has been defeated!")
-                                if dm:
-                                    death_narration = dm.narrate_death(goblin.name, player.name)
-                                    if death_narration:
-                                        print(f"\n📖 {death_narration}")
-                        else:
-                            print(f"\n❌ No spell slots available for level {spell.level}!")
-                            continue
-                    else:
-                        print("Invalid choice!")
-                        continue
-            else:
-                print(f"\n🗡️  {combatant.name}'s turn!")
-                damage = combat.attack(combatant, player)
-                if damage > 0:
-                    print(f"💥 The {combatant.name} hits you with their {combatant.weapon.name} for {damage} damage!")
-                    if not player.is_alive():
-                        print(f"\n💀 You have been defeated by the {combatant.name}!")
-                        if dm:
-                            death_narration = dm.narrate_death(player.name, combatant.name)
-                            if death_narration:
-                                print(f"\n📖 {death_narration}")
-                        return False
-                else:
-                    print(f"❌ The {combatant.name} missed!")
-    
+
+            outcome = turns[combatant](combat)
+            if outcome is not None:
+                _flush_narrations(combat)
+                return outcome
+
+    _flush_narrations(combat)
+    combat.round = round_num
     winner = combat.get_winner()
     if winner == player:
         player.gain_experience(goblin.xp_value)
-    
+
     return winner == player
 
 
+def _fight(player: Character, dm: Optional[DungeonMaster]) -> bool:
+    """Menu action: fight a goblin. Returns False once the game is over."""
+    victory = combat_encounter(player, dm)
+    if victory:
+        print(_NL_DIV)
+        print("🎉 VICTORY! You defeated the goblin!")
+        print(_DIV)
+    elif not player.is_alive():
+        print(_NL_DIV)
+        print("💀 GAME OVER! Your character has fallen in battle.")
+        print(f"Final Level: {player.level}")
+        print(f"Total XP: {player.experience}")
+        print(_DIV)
+        return False
+    else:
+        print(_NL_DIV)
+        print("🏃 You escaped safely!")
+        print(_DIV)
+    return True
+
+
+def _view_character(player: Character, dm: Optional[DungeonMaster]) -> bool:
+    """Menu action: show the character sheet."""
+    display_character(player)
+    return True
+
+
+def _change_weapon(player: Character, dm: Optional[DungeonMaster]) -> bool:
+    """Menu action: pick a different weapon."""
+    choose_weapon(player)
+    return True
+
+
+def _rest(player: Character, dm: Optional[DungeonMaster]) -> bool:
+    """Menu action: restore HP and spell slots."""
+    player.rest()
+    return True
+
+
+def _quit(player: Character, dm: Optional[DungeonMaster]) -> bool:
+    """Menu action: print the final summary and end the game."""
+    print(_NL_DIV)
+    print("Thanks for playing!")
+    print(f"Final Level: {player.level}")
+    print(f"Total XP: {player.experience}")
+    print(_DIV)
+    return False
+
+
+# Main menu choices; each action returns whether the game continues
+_MENU_ACTIONS: Dict[str, Callable[[Character, Optional[DungeonMaster]], bool]] = {
+    "1": _fight,
+    "2": _view_character,
+    "3": _change_weapon,
+    "4": _rest,
+    "5": _quit,
+}
+
+
 def main() -> None:
     """Main game loop with optional AI narration."""
     dm = DungeonMaster()
@@ -246,56 +505,21 @@ def main() -> None:
         print("\n🎲 AI Dungeon Master enabled! Prepare for epic narration! 🎲\n")
     else:
         print("\n📜 Playing in classic mode (no AI narration)\n")
-    
+
     player = create_character()
 
     while player.is_alive():
-        print("\n" + "="*50)
-        print("What would you like to do?")
-        print("="*50)
-        print("1. Fight a goblin")
-        print("2. View character")
-        print("3. Change weapon")
-        print("4. Rest (restore HP and spells)")
-        print("5. Quit")
+        print(_MENU_TEXT)
 
         while True:
             choice = input("\nEnter choice (1-5): ").strip()
-            if choice in ["1", "2", "3", "4", "5"]:
+            if choice in _MENU_ACTIONS:
                 break
             print("Invalid choice! Please enter 1-5.")
 
-        if choice == "1":
-            victory = combat_encounter(player, dm)
-            if victory:
-                print("\n" + "="*50)
-                print("🎉 VICTORY! You defeated the goblin!")
-                print("="*50)
-            elif not player.is_alive():
-                print("\n" + "="*50)
-                print("💀 GAME OVER! Your character has fallen in battle.")
-                print(f"Final Level: {player.level}")
-                print(f"Total XP: {player.experience}")
-                print("="*50)
-                break
-            else:
-                print("\n" + "="*50)
-                print("🏃 You escaped safely!")
-                print("="*50)
-        elif choice == "2":
-            display_character(player)
-        elif choice == "3":
-            choose_weapon(player)
-        elif choice == "4":
-            player.rest()
-        elif choice == "5":
-            print("\n" + "="*50)
-            print("Thanks for playing!")
-            print(f"Final Level: {player.level}")
-            print(f"Total XP: {player.experience}")
-            print("="*50)
+        if not _MENU_ACTIONS[choice](player, dm):
             break
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,67 @@
+import copy
+
+import pytest
+from dndgame.character import Character
+from dndgame.races import Human
+from tests.helpers import clone_goblin, fresh_stats, seq
+
+
+@pytest.fixture
+def fixed_rolls(monkeypatch):
+    """Script the dice: every randint call returns the next scripted face.
+
+    Pass a list of faces to return them in order, or a single int to
+    return that face for every roll, e.g. ``fixed_rolls([15, 3])`` or
+    ``fixed_rolls(1)``.
+    """
+
+    def _set(faces):
+        if isinstance(faces, int):
+            monkeypatch.setattr("dndgame.dice.random.randint", lambda low, high: faces)
+        else:
+            monkeypatch.setattr("dndgame.dice.random.randint", seq(faces))
+
+    return _set
+
+
+@pytest.fixture(scope="session")
+def _player_template():
+    """A test player character, built once per session."""
+    human_race = Human()
+    char = Character("Hero", human_race, 10)
+    char.stats = fresh_stats(STR=16, DEX=14, CON=14)
+    char.hp = 12
+    char.max_hp = 12
+    return char
+
+
+@pytest.fixture
+def player(_player_template):
+    """Create a test player character."""
+    return copy.deepcopy(_player_template)
+
+
+@pytest.fixture
+def goblin():
+    """Create a test goblin enemy."""
+    return clone_goblin()
+
+
+@pytest.fixture
+def caster_int16():
+    """Create a full-health wizard with INT 16 (+3)."""
+    caster = Character("Wizard", Human(), 10)
+    caster.stats = fresh_stats(INT=16)
+    caster.hp = 10
+    caster.max_hp = 10
+    return caster
+
+
+@pytest.fixture
+def caster_int14():
+    """Create a wounded cleric (5 of 10 HP) with INT 14 (+2)."""
+    caster = Character("Cleric", Human(), 10)
+    caster.stats = fresh_stats(INT=14)
+    caster.hp = 5
+    caster.max_hp = 10
+    return caster
@@ -0,0 +1,54 @@
+"""Plain helpers shared by the test modules; fixtures live in conftest.py."""
+
+import copy
+import functools
+from types import MappingProxyType
+
+from dndgame.enemy import create_goblin
+
+# All six ability scores at 10 (a +0 modifier); copy it with fresh_stats()
+BASE_STATS_10 = MappingProxyType(
+    {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+)
+
+
+def fresh_stats(**overrides):
+    """Return a new six-stat dict at 10, with any stats overridden.
+
+    Example:
+        >>> fresh_stats(STR=16, CON=14)["STR"]
+        16
+    """
+    stats = dict(BASE_STATS_10)
+    stats.update(overrides)
+    return stats
+
+
+@functools.lru_cache(maxsize=1)
+def _goblin_template():
+    """Build the goblin prototype on first use; later calls reuse it."""
+    return create_goblin()
+
+
+def clone_goblin(name=None):
+    """Return a fresh goblin copied from the prototype, optionally renamed.
+
+    The copy skips Enemy.__init__; only the stats dict is mutable, so it
+    is the one thing that gets its own copy.
+
+    Example:
+        >>> clone_goblin("Goblin 2").name
+        'Goblin 2'
+    """
+    proto = _goblin_template()
+    goblin = copy.copy(proto)
+    goblin.stats = dict(proto.stats)
+    if name:
+        goblin.name = name
+    return goblin
+
+
+def seq(values):
+    """Return a stand-in function that yields ``values`` in order, one per call."""
+    it = iter(values)
+    return lambda *args, **kwargs: next(it)
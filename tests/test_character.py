@@ -1,7 +1,11 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock
 from dndgame.character import Character
 from dndgame.races import Human, Elf, Dwarf, Halfling
+from tests.helpers import fresh_stats
+
+# A single batched draw whose eighteen base-6 digits are all 2, i.e. every d6 shows 3
+ALL_THREES_DRAW = sum(2 * 6**i for i in range(18))
 
 
 def test_character_initialization():
@@ -16,14 +20,14 @@ def test_character_initialization():
     assert char.base_hp == 10
 
 
-def test_character_stat_rolling():
+def test_character_stat_rolling(monkeypatch):
     """Test that stats are rolled and in valid range."""
     human_race = Human()
     char = Character("TestChar", human_race, 10)
 
     # Mock dice rolls to get predictable values
-    with patch("dndgame.dice.random.randint", return_value=3):
-        char.initialize_stats()
+    monkeypatch.setattr("dndgame.dice.random.randrange", lambda stop: ALL_THREES_DRAW)
+    char.initialize_stats()
 
     # All stats should exist
     expected_stats = ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
@@ -33,6 +37,15 @@ def test_character_stat_rolling():
         assert char.stats[stat] == 10
 
 
+def test_roll_stats_quiet(capsys):
+    """Test that verbose=False suppresses the stat-rolling output."""
+    char = Character("TestChar", Human(), 10)
+    char.roll_stats(verbose=False)
+
+    assert capsys.readouterr().out == ""
+    assert len(char.stats) == 6
+
+
 def test_get_modifier():
     """Test ability modifier calculation."""
     human_race = Human()
@@ -44,52 +57,71 @@ def test_get_modifier():
     assert char.get_modifier("CON") == -1
 
 
-def test_racial_bonuses_human():
-    """Test human racial bonuses."""
+def test_get_modifier_extremes():
+    """Test modifier lookup at the edges of the rollable range."""
     human_race = Human()
     char = Character("TestChar", human_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    char.apply_racial_bonuses()
+    char.stats = {"STR": 3, "DEX": 1, "CON": 20, "INT": 30}
 
-    # All stats should be +1
-    for stat in char.stats.values():
-        assert stat == 11
+    assert char.get_modifier("STR") == -4
+    assert char.get_modifier("DEX") == -5
+    assert char.get_modifier("CON") == 5
+    assert char.get_modifier("INT") == 10
 
 
-def test_racial_bonuses_elf():
-    """Test elf racial bonuses."""
-    elf_race = Elf()
-    char = Character("TestChar", elf_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    char.apply_racial_bonuses()
+def test_get_modifier_outside_table():
+    """Test scores outside the 0-50 table still use (score - 10) // 2."""
+    char = Character("TestChar", Human(), 10)
+    char.stats = {"STR": -1, "DEX": 51, "CON": 100}
 
-    assert char.stats["DEX"] == 12
-    assert char.stats["STR"] == 10
-    assert char.stats["CON"] == 10
+    assert char.get_modifier("STR") == -6
+    assert char.get_modifier("DEX") == 20
+    assert char.get_modifier("CON") == 45
 
 
-def test_racial_bonuses_dwarf():
-    """Test dwarf racial bonuses."""
+def test_modifiers_refresh_on_stat_change():
+    """Test cached modifiers follow stat reassignment and racial bonuses."""
     dwarf_race = Dwarf()
     char = Character("TestChar", dwarf_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+    char.stats = fresh_stats(CON=13)
+    assert char.modifiers["CON"] == 1
+
+    char.apply_racial_bonuses()  # CON 13 -> 15
+    assert char.get_modifier("CON") == 2
+
+    char.stats = {"STR": 18}
+    assert char.modifiers == {"STR": 4}
+    assert char.str_mod == 4
+    assert char.con_mod == 0  # Missing stats fall back to 0
+
+
+def test_stat_block_follows_stat_changes():
+    """Test the rendered stat block is rebuilt with the modifiers."""
+    char = Character("TestChar", Dwarf(), 10)
+    char.stats = {"STR": 16, "CON": 9}
+    assert char.stat_block == "STR: 16 (+3)\nCON: 9 (-1)"
+
+    char.apply_racial_bonuses()  # CON 9 -> 11
+    assert char.stat_block == "STR: 16 (+3)\nCON: 11 (+0)"
+
+
+@pytest.mark.parametrize(
+    "race_cls,expected",
+    [
+        (Human, {"STR": 11, "DEX": 11, "CON": 11, "INT": 11, "WIS": 11, "CHA": 11}),
+        (Elf, {"DEX": 12, "STR": 10, "CON": 10}),
+        (Dwarf, {"CON": 12, "STR": 10, "DEX": 10}),
+        (Halfling, {"DEX": 12, "CHA": 11, "STR": 10}),
+    ],
+)
+def test_racial_bonuses(race_cls, expected):
+    """Test each race's bonuses are applied to the character's stats."""
+    char = Character("TestChar", race_cls(), 10)
+    char.stats = fresh_stats()
     char.apply_racial_bonuses()
 
-    assert char.stats["CON"] == 12
-    assert char.stats["STR"] == 10
-    assert char.stats["DEX"] == 10
-
-
-def test_racial_bonuses_halfling():
-    """Test halfling racial bonuses."""
-    halfling_race = Halfling()
-    char = Character("TestChar", halfling_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    char.apply_racial_bonuses()
-
-    assert char.stats["DEX"] == 12
-    assert char.stats["CHA"] == 11
-    assert char.stats["STR"] == 10
+    for stat, value in expected.items():
+        assert char.stats[stat] == value
 
 
 def test_hp_calculation():
@@ -108,7 +140,7 @@ def test_hp_recalculation_after_racial_bonus():
     """Test that HP is recalculated after racial bonuses are applied."""
     dwarf_race = Dwarf()
     char = Character("TestChar", dwarf_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10}
+    char.stats = fresh_stats(CON=14)
     # CON 14 = +2 modifier, so HP should be 12
     char.max_hp = char.base_hp + char.get_modifier("CON")
     char.hp = char.max_hp
@@ -124,6 +156,20 @@ def test_hp_recalculation_after_racial_bonus():
     assert char.hp == 13
 
 
+def test_racial_bonus_without_con_keeps_hp():
+    """Test races that don't touch CON leave HP alone."""
+    elf_race = Elf()
+    char = Character("TestChar", elf_race, 10)
+    char.stats = fresh_stats(CON=14)
+    char.max_hp = 12
+    char.hp = 7
+
+    char.apply_racial_bonuses()
+
+    assert char.max_hp == 12
+    assert char.hp == 7
+
+
 def test_character_is_alive():
     """Test is_alive method."""
     human_race = Human()
@@ -151,24 +197,26 @@ def test_character_take_damage():
     assert char.hp == 0  # Should not go negative
 
 
-def test_initialize_stats_calls_both_methods():
+def test_initialize_stats_calls_both_methods(monkeypatch):
     """Test that initialize_stats calls roll_stats and apply_racial_bonuses."""
     human_race = Human()
     char = Character("TestChar", human_race, 10)
 
-    with patch("dndgame.dice.random.randint", return_value=3):
-        char.initialize_stats()
+    monkeypatch.setattr("dndgame.dice.random.randrange", lambda stop: ALL_THREES_DRAW)
+    char.initialize_stats()
 
     # Stats should be rolled (9) and have human bonus applied (+1) = 10
     assert all(char.stats[stat] == 10 for stat in char.stats)
     # HP should be calculated
     assert char.hp > 0
     assert char.max_hp > 0
+
+
 def test_character_starts_at_level_1():
     """Test character starts at level 1 with 0 XP."""
     human_race = Human()
     char = Character("TestChar", human_race, 10)
-    
+
     assert char.level == 1
     assert char.experience == 0
     assert char.experience_to_next_level == 100
@@ -178,43 +226,137 @@ def test_gain_experience():
     """Test gaining experience points."""
     human_race = Human()
     char = Character("TestChar", human_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+    char.stats = fresh_stats()
     char.hp = 10
     char.max_hp = 10
-    
+
     char.gain_experience(50)
     assert char.experience == 50
     assert char.level == 1  # Not enough to level up
 
 
-def test_level_up():
+def test_level_up(monkeypatch):
     """Test leveling up when reaching XP threshold."""
     human_race = Human()
     char = Character("TestChar", human_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10}
+    char.stats = fresh_stats(CON=14)
     char.hp = 12
     char.max_hp = 12
-    
+
     initial_max_hp = char.max_hp
-    
-    with patch("dndgame.dice.random.randint", return_value=5):
-        char.gain_experience(100)  # Exactly enough to level up
-    
+
+    # The level's d8 is read off a single draw: digit 4 is a face of 5
+    monkeypatch.setattr("dndgame.dice.random.randrange", lambda stop: 4)
+    char.gain_experience(100)  # Exactly enough to level up
+
     assert char.level == 2
     assert char.experience == 0  # XP reset after level up
     assert char.experience_to_next_level == 150  # 1.5x increase
-    assert char.max_hp > initial_max_hp  # HP should increase
+    assert char.max_hp == initial_max_hp + 5 + 2  # d8 of 5 plus +2 CON
 
 
 def test_multiple_level_ups():
     """Test multiple level ups from large XP gain."""
     human_race = Human()
     char = Character("TestChar", human_race, 10)
-    char.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+    char.stats = fresh_stats()
     char.hp = 10
     char.max_hp = 10
-    
-    with patch("dndgame.dice.random.randint", return_value=4):
-        char.gain_experience(300)  # Enough for 2 levels
-    
-    assert char.level >= 2
\ No newline at end of file
+
+    char.gain_experience(300)  # Enough for 2 levels
+
+    assert char.level >= 2
+
+
+def test_multiple_level_ups_single_hp_roll(monkeypatch):
+    """Test several level-ups from one award roll HP as a single batch."""
+    human_race = Human()
+    char = Character("TestChar", human_race, 10)
+    char.stats = fresh_stats(CON=14)
+    char.hp = 12
+    char.max_hp = 12
+
+    # Two d8s as base-8 digits 3, 3: both show 4
+    mock_randrange = Mock(return_value=3 + 3 * 8)
+    monkeypatch.setattr("dndgame.dice.random.randrange", mock_randrange)
+    char.gain_experience(300)  # 100 + 150 crosses two thresholds
+
+    assert char.level == 3
+    assert char.experience == 50
+    assert char.experience_to_next_level == 225
+    mock_randrange.assert_called_once_with(8**2)  # One draw for both d8s
+    assert char.max_hp == 12 + 2 * (4 + 2)  # Two d8s of 4 plus +2 CON each
+    assert char.max_spell_slots[2] == 2
+    assert char.active_slot_levels == (1, 2)
+
+
+def test_level_up_min_hp_per_level(monkeypatch, capsys):
+    """Test each level gained is worth at least 1 HP, even with low CON."""
+    char = Character("TestChar", Human(), 10)
+    char.stats = fresh_stats(CON=4)  # -3 modifier
+    char.hp = 7
+    char.max_hp = 7
+
+    # Two d8s as base-8 digits 7, 0: an 8 and a 1
+    monkeypatch.setattr("dndgame.dice.random.randrange", lambda stop: 7)
+    char.level_up(2)
+
+    assert char.max_hp == 7 + (8 - 3) + 1  # The 1 - 3 roll still gives 1 HP
+    assert char.hp == 13
+    out = capsys.readouterr().out
+    assert "Rolling 2d8 for HP: [8, 1] (-3 CON each)" in out
+    assert "HP increased by 6!" in out
+
+
+def test_xp_thresholds_grow_by_half():
+    """Test each level needs 1.5x (rounded down) the XP of the one before."""
+    char = Character("TestChar", Human(), 10)
+    char.stats = fresh_stats()
+
+    char.gain_experience(100 + 150 + 225 + 10)
+
+    assert char.level == 4
+    assert char.experience == 10
+    assert char.experience_to_next_level == 337
+
+
+def test_xp_beyond_threshold_table():
+    """Test huge XP awards keep levelling past the precomputed thresholds."""
+    char = Character("TestChar", Human(), 10)
+    char.stats = fresh_stats()
+
+    char.gain_experience(10**21)
+
+    assert char.level > 100
+    assert 0 <= char.experience < char.experience_to_next_level
+
+
+def test_spell_slots_by_level():
+    """Test spell slot checks and usage indexed by spell level."""
+    char = Character("TestChar", Human(), 10)
+
+    assert char.can_cast(0)
+    assert char.can_cast(1)
+    assert not char.can_cast(2)  # No level 2 slots at level 1
+    assert not char.can_cast(5)  # Level out of range
+    assert not char.can_cast(-1)
+    assert char.active_slot_levels == (1,)
+
+    assert char.use_spell_slot(1)
+    assert char.use_spell_slot(1)
+    assert not char.use_spell_slot(1)  # Level 1 slots exhausted
+    assert char.spell_slots[1] == 0
+
+    assert char.use_spell_slot(0)
+    assert char.spell_slots[0] == 999  # Cantrips are never consumed
+
+
+def test_rest_restores_spell_slots():
+    """Test resting refills slots without sharing the max list."""
+    char = Character("TestChar", Human(), 10)
+    char.use_spell_slot(1)
+
+    char.rest()
+
+    assert char.spell_slots == char.max_spell_slots
+    assert char.spell_slots is not char.max_spell_slots
@@ -1,31 +1,23 @@
 import pytest
-from unittest.mock import patch
-from dndgame.character import Character
-from dndgame.enemy import Enemy, create_goblin
+from unittest.mock import Mock
 from dndgame.combat import Combat
-from dndgame.races import Human
+from dndgame.weapons import Weapon
+from tests.helpers import clone_goblin, fresh_stats
 
-
-@pytest.fixture
-def player():
-    """Create a test player character."""
-    human_race = Human()
-    char = Character("Hero", human_race, 10)
-    char.stats = {"STR": 16, "DEX": 14, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10}
-    char.hp = 12
-    char.max_hp = 12
-    return char
+# The test player has STR 16 (+3): a damage die of 3 plus the modifier
+EXPECTED_STR16_HIT_DAMAGE = 3 + 3
+# Greatsword damage dice of 2 and 5, plus the same +3 STR
+EXPECTED_GREATSWORD_DAMAGE = 2 + 5 + 3
 
 
 @pytest.fixture
-def goblin():
-    """Create a test goblin enemy."""
-    return create_goblin()
+def combat(player, goblin):
+    """Create a one-on-one combat between the test player and goblin."""
+    return Combat(player, goblin)
 
 
-def test_combat_initialization(player, goblin):
+def test_combat_initialization(combat, player, goblin):
     """Test combat is initialized correctly."""
-    combat = Combat(player, goblin)
     assert len(combat.combatants) == 2
     assert combat.round == 0
     assert len(combat.initiative_order) == 0
@@ -35,18 +27,16 @@ def test_combat_initialization(player, goblin):
 
 def test_combat_multiple_combatants(player, goblin):
     """Test combat can handle multiple combatants."""
-    goblin2 = create_goblin("Goblin 2")
+    goblin2 = clone_goblin("Goblin 2")
     combat = Combat(player, goblin, goblin2)
 
     assert len(combat.combatants) == 3
 
 
-def test_roll_initiative(player, goblin):
+def test_roll_initiative(combat, player, goblin, fixed_rolls):
     """Test initiative rolling."""
-    combat = Combat(player, goblin)
-
-    with patch("dndgame.dice.random.randint", side_effect=[15, 10]):
-        order = combat.roll_initiative()
+    fixed_rolls([15, 10])
+    order = combat.roll_initiative()
 
     assert len(order) == 2
     assert player in order
@@ -55,149 +45,123 @@ def test_roll_initiative(player, goblin):
     assert order[0] == player
 
 
-def test_roll_initiative_ordering(player, goblin):
+def test_roll_initiative_ordering(combat, player, goblin, fixed_rolls):
     """Test that initiative order is correct."""
-    combat = Combat(player, goblin)
-
     # Mock so goblin goes first
-    with patch("dndgame.dice.random.randint", side_effect=[5, 18]):
-        order = combat.roll_initiative()
+    fixed_rolls([5, 18])
+    order = combat.roll_initiative()
 
     assert order[0] == goblin
     assert order[1] == player
 
 
-def test_attack_hit_deals_damage(player, goblin):
+def test_roll_initiative_ties_keep_join_order(player, goblin, fixed_rolls):
+    """Test tied initiative keeps the order combatants were added."""
+    goblin2 = clone_goblin("Goblin 2")
+    combat = Combat(goblin, goblin2, player)
+
+    # Both goblins (+2 DEX) total 12; player (+2 DEX) totals 20
+    fixed_rolls([10, 10, 18])
+    order = combat.roll_initiative()
+
+    assert order == [player, goblin, goblin2]
+
+
+def test_attack_hit_deals_damage(combat, player, goblin, fixed_rolls):
     """Test successful attack deals damage."""
-    combat = Combat(player, goblin)
     initial_hp = goblin.hp
 
     # Force a hit: high attack roll
-    with patch("dndgame.dice.random.randint", side_effect=[20, 6]):
-        damage = combat.attack(player, goblin)
+    fixed_rolls([20, 6])
+    damage = combat.attack(player, goblin)
 
     assert damage > 0
     assert goblin.hp < initial_hp
 
 
-def test_attack_miss_deals_no_damage(player, goblin):
+def test_attack_miss_deals_no_damage(combat, player, goblin, fixed_rolls):
     """Test missed attack deals no damage."""
-    combat = Combat(player, goblin)
     initial_hp = goblin.hp
 
     # Force a miss: low attack roll
-    with patch("dndgame.dice.random.randint", return_value=1):
-        damage = combat.attack(player, goblin)
+    fixed_rolls(1)
+    damage = combat.attack(player, goblin)
 
     assert damage == 0
     assert goblin.hp == initial_hp
 
 
-def test_attack_minimum_damage():
+def test_attack_minimum_damage(combat, player, goblin, fixed_rolls):
     """Test that successful attacks deal at least 1 damage even with negative STR."""
-    human_race = Human()
-    weak_character = Character("Weak", human_race, 10)
-    weak_character.stats = {
-        "STR": 3,
-        "DEX": 10,
-        "CON": 10,
-        "INT": 10,
-        "WIS": 10,
-        "CHA": 10,
-    }
-    weak_character.hp = 10
-    weak_character.max_hp = 10
-
-    goblin = create_goblin()
-    combat = Combat(weak_character, goblin)
+    player.stats = fresh_stats(STR=3)  # -4 modifier
 
     # Force hit with low damage roll
-    with patch("dndgame.dice.random.randint", side_effect=[20, 1]):
-        damage = combat.attack(weak_character, goblin)
+    fixed_rolls([20, 1])
+    damage = combat.attack(player, goblin)
 
     # Even with negative STR modifier and low roll, should deal at least 1 damage
     assert damage >= 1
 
 
-def test_is_combat_over_both_alive(player, goblin):
-    """Test combat is not over when both are alive."""
-    combat = Combat(player, goblin)
-
-    assert not combat.is_combat_over()
-
-
-def test_is_combat_over_one_dead(player, goblin):
-    """Test combat is over when one dies."""
-    combat = Combat(player, goblin)
+def test_attack_rolls_all_weapon_dice(combat, player, goblin, fixed_rolls):
+    """Test multi-die weapons sum every damage die."""
+    player.weapon = Weapon("Greatsword", 6, 2)
 
-    goblin.hp = 0
-    assert combat.is_combat_over()
+    # Attack roll 15, then the two damage dice
+    fixed_rolls([15, 2, 5])
+    damage = combat.attack(player, goblin)
 
+    assert damage == EXPECTED_GREATSWORD_DAMAGE
 
-def test_is_combat_over_player_dead(player, goblin):
-    """Test combat is over when player dies."""
-    combat = Combat(player, goblin)
 
-    player.hp = 0
-    assert combat.is_combat_over()
+def test_attack_narrates_without_blocking(player, goblin, fixed_rolls):
+    """Test hits and misses hand narration to the DM's background path."""
+    dm = Mock()
+    combat = Combat(player, goblin, dungeon_master=dm)
 
+    fixed_rolls([15, 3])
+    damage = combat.attack(player, goblin)
+    dm.narrate_attack_async.assert_called_once_with(
+        "Hero", "Goblin", player.weapon.name, damage, is_critical=False
+    )
 
-def test_get_winner_no_winner_yet(player, goblin):
-    """Test no winner when combat ongoing."""
-    combat = Combat(player, goblin)
+    fixed_rolls(1)
+    combat.attack(player, goblin)
+    dm.narrate_miss_async.assert_called_once_with("Hero", "Goblin")
+    dm.narrate_attack.assert_not_called()
+    dm.narrate_miss.assert_not_called()
 
-    assert combat.get_winner() is None
 
+@pytest.mark.parametrize(
+    "player_hp,goblin_hp,over,winner",
+    [
+        (12, 7, False, None),
+        (12, 0, True, "player"),
+        (0, 7, True, "goblin"),
+        (0, 0, True, None),
+    ],
+)
+def test_combat_state(combat, player, goblin, player_hp, goblin_hp, over, winner):
+    """Test combat end and winner for each combination of who is still standing."""
+    player.hp, goblin.hp = player_hp, goblin_hp
 
-def test_get_winner_player_wins(player, goblin):
-    """Test player is winner when enemy dies."""
-    combat = Combat(player, goblin)
+    assert combat.is_combat_over() == over
+    assert (
+        combat.get_winner() is {"player": player, "goblin": goblin, None: None}[winner]
+    )
 
-    goblin.hp = 0
-    assert combat.get_winner() == player
 
-
-def test_get_winner_enemy_wins(player, goblin):
-    """Test enemy is winner when player dies."""
-    combat = Combat(player, goblin)
-
-    player.hp = 0
-    assert combat.get_winner() == goblin
-
-
-def test_get_winner_both_dead(player, goblin):
-    """Test no winner when both die."""
-    combat = Combat(player, goblin)
-
-    player.hp = 0
-    goblin.hp = 0
-    assert combat.get_winner() is None
-
-
-def test_attack_uses_strength_modifier(player, goblin):
+def test_attack_uses_strength_modifier(combat, player, goblin, fixed_rolls):
     """Test that attacks use the attacker's STR modifier."""
-    combat = Combat(player, goblin)
-
-    # Player has STR 16 (+3 modifier)
-    # Mock: attack roll = 15, damage roll = 3
-    # Total damage should be 3 + 3 = 6
-    with patch("dndgame.dice.random.randint", side_effect=[15, 3]):
-        damage = combat.attack(player, goblin)
+    # Attack roll 15, then a damage roll of 3
+    fixed_rolls([15, 3])
+    damage = combat.attack(player, goblin)
 
-    assert damage == 6  # 3 (roll) + 3 (STR modifier)
+    assert damage == EXPECTED_STR16_HIT_DAMAGE
 
 
-def test_combat_round_tracking():
+def test_combat_round_tracking(combat):
     """Test that combat round increments properly."""
-    human_race = Human()
-    player = Character("Hero", human_race, 10)
-    player.stats = {"STR": 16, "DEX": 14, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10}
-    player.hp = 12
-    player.max_hp = 12
-
-    goblin = create_goblin()
-    combat = Combat(player, goblin)
-
     assert combat.round == 0
     combat.round += 1
     assert combat.round == 1
@@ -1,56 +1,96 @@
-from unittest.mock import patch
-from dndgame.dice import roll, roll_with_advantage, roll_with_disadvantage
+import random
+from unittest.mock import Mock
 
+import pytest
+from dndgame.dice import (
+    roll,
+    roll_batch,
+    set_seed,
+    roll_with_advantage,
+    roll_with_disadvantage,
+)
 
-def test_roll():
+
+def test_roll(fixed_rolls):
     """Test basic dice rolling with mocked random values."""
-    with patch(
-        "random.randint", return_value=4
-    ):  # random.randint will return 4 when called in this context
-        result = roll(6, 1)
-        assert result == 4
+    fixed_rolls(4)
+    result = roll(6, 1)
+    assert result == 4
+
+    fixed_rolls(3)
+    result = roll(20, 2)
+    assert result == 6  # 3 + 3 = 6
+
+    fixed_rolls([1, 2])
+    result = roll(6, 1)
+    assert result == 1
+
+    result = roll(20, 1)
+    assert result == 2
 
-    with patch(
-        "random.randint", return_value=3
-    ):  # random.randint will return 3 when called in this context
-        result = roll(20, 2)
-        assert result == 6  # 3 + 3 = 6
 
-    with patch(
-        "random.randint", side_effect=[1, 2]
-    ):  # random.randint will first return 1, then 2 when called in this context
-        result = roll(6, 1)
-        assert result == 1
+def test_roll_prints_each_die(capsys, fixed_rolls):
+    """Test single and multi-die rolls report the same format."""
+    fixed_rolls(5)
+    roll(8, 1)
+    roll(8, 2)
 
-        result = roll(20, 1)
-        assert result == 2
+    assert capsys.readouterr().out == "Rolling 1d8: [5] = 5\nRolling 2d8: [5, 5] = 10\n"
 
 
-def test_roll_with_advantage():
+def test_roll_with_advantage(fixed_rolls):
     """Test advantage rolls (take highest of two)."""
-    with patch(
-        "random.randint", side_effect=[3, 5]
-    ):  # random.randint will first return 3, then 5 when called in this context
-        result = roll_with_advantage(20)
-        assert result == 5  # 5 is the highest of the two rolls
+    fixed_rolls([3, 5])
+    result = roll_with_advantage(20)
+    assert result == 5  # 5 is the highest of the two rolls
 
-    with patch(
-        "random.randint", side_effect=[6, 2]
-    ):  # random.randint will first return 6, then 2 when called in this context
-        result = roll_with_advantage(6)
-        assert result == 6  # 6 is the highest of the two rolls
+    fixed_rolls([6, 2])
+    result = roll_with_advantage(6)
+    assert result == 6  # 6 is the highest of the two rolls
 
 
-def test_roll_with_disadvantage():
+def test_roll_with_disadvantage(fixed_rolls):
     """Test disadvantage rolls (take lowest of two)."""
-    with patch(
-        "random.randint", side_effect=[3, 5]
-    ):  # random.randint will first return 3, then 5 when called in this context
-        result = roll_with_disadvantage(20)
-        assert result == 3  # 3 is the lowest of the two rolls
-
-    with patch(
-        "random.randint", side_effect=[6, 2]
-    ):  # random.randint will first return 6, then 2 when called in this context
-        result = roll_with_disadvantage(6)
-        assert result == 2  # 2 is the lowest of the two rolls
+    fixed_rolls([3, 5])
+    result = roll_with_disadvantage(20)
+    assert result == 3  # 3 is the lowest of the two rolls
+
+    fixed_rolls([6, 2])
+    result = roll_with_disadvantage(6)
+    assert result == 2  # 2 is the lowest of the two rolls
+
+
+def test_roll_batch(monkeypatch):
+    """Test batched rolls decode each die from a single draw."""
+    # Base-6 digits (least significant first): 0,1,2 | 5,5,5 -> faces 1,2,3 | 6,6,6
+    draw = 0 + 1 * 6 + 2 * 6**2 + 5 * 6**3 + 5 * 6**4 + 5 * 6**5
+    mock_randrange = Mock(return_value=draw)
+    monkeypatch.setattr("dndgame.dice.random.randrange", mock_randrange)
+    result = roll_batch(6, 3, 2)
+
+    mock_randrange.assert_called_once_with(6**6)
+    assert result == [6, 18]
+
+
+def test_roll_batch_range():
+    """Test batched 3d6 totals always fall within 3-18."""
+    for total in roll_batch(6, 3, 6):
+        assert 3 <= total <= 18
+
+
+@pytest.fixture
+def restore_random_state():
+    """Put the shared generator back as it was, so seeding doesn't leak into later tests."""
+    state = random.getstate()
+    yield
+    random.setstate(state)
+
+
+def test_set_seed_reproducible(restore_random_state):
+    """Test seeding makes roll sequences repeatable."""
+    set_seed(42)
+    first = [roll(20, 1) for _ in range(5)] + roll_batch(6, 3, 6)
+    set_seed(42)
+    second = [roll(20, 1) for _ in range(5)] + roll_batch(6, 3, 6)
+
+    assert first == second
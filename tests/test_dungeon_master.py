@@ -0,0 +1,140 @@
+import itertools
+import time
+from types import SimpleNamespace
+
+import pytest
+from dndgame.dungeon_master import DungeonMaster
+
+
+class StubClient:
+    """Stand-in for the OpenAI client that numbers its replies.
+
+    Each reply is ``"#<call number> <user prompt>"``. Prompts containing
+    ``slow_word`` take a moment to answer, so tests can make requests
+    finish out of order; ``fail=True`` makes every request raise.
+    """
+
+    def __init__(self, slow_word=None, fail=False):
+        self.slow_word = slow_word
+        self.fail = fail
+        self.calls = 0
+        self._numbers = itertools.count()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, messages, **kwargs):
+        number = next(self._numbers)
+        self.calls = number + 1
+        if self.fail:
+            raise RuntimeError("API down")
+        prompt = messages[-1]["content"]
+        if self.slow_word and self.slow_word in prompt:
+            time.sleep(0.2)
+        message = SimpleNamespace(content=f"#{number} {prompt}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def reply_number(narration):
+    """Return which stub call produced a narration."""
+    return int(narration.split()[0][1:])
+
+
+@pytest.fixture
+def dm():
+    """Create a Dungeon Master narrating through a stub client."""
+    return DungeonMaster(client=StubClient(slow_word="Slowpoke"))
+
+
+def test_background_narrations_wait_for_flush(dm, capsys):
+    """Test async narrations print only on flush, in the order requested."""
+    dm.narrate_miss_async("Slowpoke", "Goblin")
+    fast = dm.narrate_miss_async("Hero", "Goblin")
+    fast.result()
+
+    assert capsys.readouterr().out == ""  # Nothing printed from the worker
+
+    dm.flush_narrations(wait=False)
+    assert capsys.readouterr().out == ""  # The slow one is still first in line
+
+    dm.flush_narrations()
+    out = capsys.readouterr().out
+    assert out.index("Slowpoke misses") < out.index("Hero misses")
+
+    dm.flush_narrations()
+    assert capsys.readouterr().out == ""  # Each narration is printed once
+
+
+def test_flush_without_waiting_prints_finished_narrations(dm, capsys):
+    """Test a non-blocking flush prints narrations that have already arrived."""
+    dm.narrate_miss_async("Hero", "Goblin").result()
+
+    dm.flush_narrations(wait=False)
+
+    assert "Hero misses" in capsys.readouterr().out
+
+
+def test_background_failure_note_waits_for_flush(capsys):
+    """Test a failed background request reports it on flush, not from the worker."""
+    dm = DungeonMaster(client=StubClient(fail=True))
+
+    assert dm.narrate_miss_async("Hero", "Goblin").result() is None
+    assert capsys.readouterr().out == ""
+
+    dm.flush_narrations()
+    assert "AI narration unavailable - API down" in capsys.readouterr().out
+
+
+def test_narrations_rotate_once_scenario_is_full(dm):
+    """Test a scenario gets three fresh lines, then reuses them in turn."""
+    lines = [dm.narrate_miss("Hero", "Goblin") for _ in range(7)]
+
+    assert [reply_number(line) for line in lines] == [0, 1, 2, 0, 1, 2, 0]
+    assert dm.client.calls == 3
+
+
+def test_attack_narrations_keyed_by_exact_damage(dm):
+    """Test hits with different damage don't share a line."""
+    three = dm.narrate_attack("Hero", "Goblin", "Longsword", 3)
+    four = dm.narrate_attack("Hero", "Goblin", "Longsword", 4)
+
+    assert "Damage: 3" in three
+    assert "Damage: 4" in four
+    assert dm.client.calls == 2
+
+
+def test_narration_cache_is_bounded(dm, monkeypatch):
+    """Test the least recently used scenario is dropped past the limit."""
+    monkeypatch.setattr("dndgame.dungeon_master._MAX_SCENARIOS", 2)
+    dm.narrate_miss("A", "Goblin")
+    dm.narrate_miss("B", "Goblin")
+    dm.narrate_miss("C", "Goblin")
+
+    assert len(dm._cache) == 2
+    assert ("miss", "A", "Goblin") not in dm._cache
+
+    dm.clear_cache()
+    assert dm._cache == {}
+
+
+def test_failed_narrations_are_not_remembered(capsys):
+    """Test an API failure gives None and is retried next time."""
+    dm = DungeonMaster(client=StubClient(fail=True))
+
+    assert dm.narrate_miss("Hero", "Goblin") is None
+    assert dm.narrate_miss("Hero", "Goblin") is None
+    assert dm.client.calls == 2
+    assert "AI narration unavailable" in capsys.readouterr().out
+
+
+def test_no_api_key_disables_narration(monkeypatch, tmp_path):
+    """Test the Dungeon Master stays quiet when no API key is configured."""
+    pytest.importorskip("dotenv")
+    monkeypatch.chdir(tmp_path)  # No .env file to load a key from
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    dm = DungeonMaster()
+
+    assert not dm.enabled
+    assert dm.client is None
+    assert dm.narrate_attack("Hero", "Goblin", "Longsword", 5) is None
+    assert dm.narrate_miss_async("Hero", "Goblin") is None
+    assert dm._cache == {}
@@ -1,4 +1,5 @@
 import pytest
+from dndgame.entity import Entity
 from dndgame.enemy import Enemy, create_goblin
 
 
@@ -66,47 +67,42 @@ def test_create_goblin_custom_name():
     assert goblin.enemy_type == "Goblin"
 
 
-def test_enemy_get_modifier():
+def test_enemy_get_modifier(goblin):
     """Test enemy ability modifiers."""
-    enemy = create_goblin()
-    assert enemy.get_modifier("DEX") == 2  # 14 DEX = +2
-    assert enemy.get_modifier("STR") == -1  # 8 STR = -1
-    assert enemy.get_modifier("CON") == 0  # 10 CON = 0
+    assert goblin.get_modifier("DEX") == 2  # 14 DEX = +2
+    assert goblin.get_modifier("STR") == -1  # 8 STR = -1
+    assert goblin.get_modifier("CON") == 0  # 10 CON = 0
 
 
-def test_enemy_is_alive():
+@pytest.mark.parametrize("hp,alive", [(7, True), (0, False), (-5, False)])
+def test_enemy_is_alive(goblin, hp, alive):
     """Test enemy alive status."""
-    enemy = create_goblin()
-    assert enemy.is_alive()
+    goblin.hp = hp
+    assert goblin.is_alive() == alive
 
-    enemy.hp = 0
-    assert not enemy.is_alive()
 
-    enemy.hp = -5
-    assert not enemy.is_alive()
-
-
-def test_enemy_take_damage():
+def test_enemy_take_damage(goblin):
     """Test enemy taking damage."""
-    enemy = create_goblin()
-    initial_hp = enemy.hp
+    initial_hp = goblin.hp
 
-    enemy.take_damage(3)
-    assert enemy.hp == initial_hp - 3
+    goblin.take_damage(3)
+    assert goblin.hp == initial_hp - 3
 
-    enemy.take_damage(20)
-    assert enemy.hp == 0  # Should not go negative
+    goblin.take_damage(20)
+    assert goblin.hp == 0  # Should not go negative
 
 
-def test_enemy_initialize_stats():
+def test_enemy_initialize_stats(goblin):
     """Test that initialize_stats does nothing (no-op for enemies)."""
-    enemy = create_goblin()
-    initial_stats = enemy.stats.copy()
+    stats = goblin.stats
+    modifiers = goblin.modifiers
 
-    enemy.initialize_stats()
+    goblin.initialize_stats()
 
-    # Stats should be unchanged
-    assert enemy.stats == initial_stats
+    # Same dicts (nothing reassigned) holding the same goblin scores
+    assert goblin.stats is stats
+    assert goblin.modifiers is modifiers
+    assert stats == {"STR": 8, "DEX": 14, "CON": 10, "INT": 10, "WIS": 8, "CHA": 8}
 
 
 def test_multiple_goblins_are_independent():
@@ -119,3 +115,20 @@ def test_multiple_goblins_are_independent():
     assert goblin1.hp == 3
     assert goblin2.hp == 7  # Should be unchanged
     assert goblin1.name != goblin2.name
+
+
+def test_enemy_recompute_modifiers_after_in_place_change(goblin):
+    """Test recompute_modifiers picks up stats edited in place."""
+    goblin.stats["STR"] = 16
+    goblin.recompute_modifiers()
+
+    assert goblin.str_mod == 3
+    assert goblin.get_modifier("STR") == 3
+    assert goblin.modifiers["STR"] == 3
+
+
+def test_entity_initialize_stats_not_implemented():
+    """Test the base entity requires subclasses to set up stats."""
+    entity = Entity("Blob", 10)
+    with pytest.raises(NotImplementedError):
+        entity.initialize_stats()
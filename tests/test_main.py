@@ -0,0 +1,108 @@
+import pytest
+from dndgame.combat import Combat
+import main
+from tests.helpers import seq
+
+
+@pytest.fixture
+def answers(monkeypatch):
+    """Script what the player types, e.g. ``answers(["x", "2"])``."""
+
+    def _set(lines):
+        monkeypatch.setattr("builtins.input", seq(lines))
+
+    return _set
+
+
+def test_player_turn_status_shown_when_piped(player, goblin, answers, capsys):
+    """Test HP and weapon are printed even when stdout isn't a terminal."""
+    answers(["3"])  # Run away
+
+    assert main._player_turn(player, goblin, Combat(player, goblin)) is False
+
+    out = capsys.readouterr().out
+    assert "Hero's HP: 12/12" in out
+    assert "Goblin HP: 7/7" in out
+    assert f"Your weapon: {player.weapon.name}" in out
+
+
+@pytest.mark.parametrize(
+    "typed,expected",
+    [
+        (["2"], 2),
+        (["abc", "2"], 2),  # Not a number
+        (["", "1"], 1),  # Nothing entered
+        (["0", "4", "3"], 3),  # Out of range on either side
+    ],
+)
+def test_read_choice(answers, capsys, typed, expected):
+    """Test choices are re-prompted until a number in range is entered."""
+    answers(typed)
+
+    assert main._read_choice("Pick: ", 1, 3) == expected
+    assert capsys.readouterr().out.count("Invalid choice!") == len(typed) - 1
+
+
+@pytest.mark.parametrize(
+    "typed,expected",
+    [
+        (["1 3"], (1, 3)),
+        (["3,1"], (3, 1)),
+        (["2 , 4"], (2, 4)),
+        (["2 2", "2 3"], (2, 3)),  # Same spell twice
+        (["1 5", "0 1", "1 4"], (1, 4)),  # Out of range
+        (["one two", "1", "1 2 3", "1 2"], (1, 2)),  # Not numbers, or not two of them
+    ],
+)
+def test_read_spell_pair(answers, capsys, typed, expected):
+    """Test spell picks are re-prompted until two different valid numbers are entered."""
+    answers(typed)
+
+    assert main._read_spell_pair(4) == expected
+    assert capsys.readouterr().out.count("Invalid choice!") == len(typed) - 1
+
+
+@pytest.fixture
+def combats(monkeypatch):
+    """Record every Combat that combat_encounter sets up."""
+    created = []
+
+    class RecordingCombat(Combat):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr("dndgame.combat.Combat", RecordingCombat)
+    return created
+
+
+def test_combat_encounter_win(player, answers, fixed_rolls, combats, capsys):
+    """Test a won encounter awards the goblin's XP and records the rounds."""
+    answers(["1", "1"])  # Attack twice
+    # Initiative 20 vs 1; round 1: player misses, goblin misses;
+    # round 2: player hits for 8 + 3 STR, more than the goblin's 7 HP
+    fixed_rolls([20, 1, 1, 1, 20, 8])
+
+    assert main.combat_encounter(player) is True
+
+    assert player.experience == 50
+    assert combats[0].round == 2
+    out = capsys.readouterr().out
+    assert "❌ The Goblin missed!" in out
+    assert "--- Round" not in out  # Cosmetic banner is for terminals only
+
+
+def test_combat_encounter_player_death(player, answers, fixed_rolls, combats, capsys):
+    """Test being killed ends the encounter with a loss and no XP."""
+    answers([])  # The goblin acts first and the player never gets a turn
+    player.hp = 1
+    # Initiative 1 vs 20; goblin hits (20 - 1 STR) for 6 - 1 STR
+    fixed_rolls([1, 20, 20, 6])
+
+    assert main.combat_encounter(player) is False
+
+    assert not player.is_alive()
+    assert player.experience == 0
+    out = capsys.readouterr().out
+    assert "The Goblin hits you with their Shortsword for 5 damage!" in out
+    assert "You have been defeated by the Goblin!" in out
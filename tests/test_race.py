@@ -1,105 +1,70 @@
+import copy
+
 import pytest
-from dndgame.races import Human, Elf, Dwarf, Halfling, get_race, AVAILABLE_RACES
+from dndgame.races import Race, Human, Elf, Dwarf, Halfling, get_race, AVAILABLE_RACES
+from tests.helpers import fresh_stats
 
 
 def test_human_initialization():
     """Test Human race is initialized correctly."""
-    human = Human()
+    human = AVAILABLE_RACES["Human"]
     assert human.name == "Human"
     assert human.description == "+1 to all stats"
 
 
-def test_human_bonuses():
-    """Test Human racial bonuses."""
-    human = Human()
-    stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    human.apply_bonuses(stats)
-
-    # All stats should be +1
-    for stat, value in stats.items():
-        assert value == 11
-
-
 def test_elf_initialization():
     """Test Elf race is initialized correctly."""
-    elf = Elf()
+    elf = AVAILABLE_RACES["Elf"]
     assert elf.name == "Elf"
     assert elf.description == "+2 DEX"
 
 
-def test_elf_bonuses():
-    """Test Elf racial bonuses."""
-    elf = Elf()
-    stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    elf.apply_bonuses(stats)
-
-    assert stats["DEX"] == 12
-    assert stats["STR"] == 10
-    assert stats["CON"] == 10
-
-
 def test_dwarf_initialization():
     """Test Dwarf race is initialized correctly."""
-    dwarf = Dwarf()
+    dwarf = AVAILABLE_RACES["Dwarf"]
     assert dwarf.name == "Dwarf"
     assert dwarf.description == "+2 CON"
 
 
-def test_dwarf_bonuses():
-    """Test Dwarf racial bonuses."""
-    dwarf = Dwarf()
-    stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    dwarf.apply_bonuses(stats)
-
-    assert stats["CON"] == 12
-    assert stats["STR"] == 10
-    assert stats["DEX"] == 10
-
-
 def test_halfling_initialization():
     """Test Halfling race is initialized correctly."""
-    halfling = Halfling()
+    halfling = AVAILABLE_RACES["Halfling"]
     assert halfling.name == "Halfling"
     assert halfling.description == "+2 DEX, +1 CHA"
 
 
-def test_halfling_bonuses():
-    """Test Halfling racial bonuses."""
-    halfling = Halfling()
-    stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    halfling.apply_bonuses(stats)
-
-    assert stats["DEX"] == 12
-    assert stats["CHA"] == 11
-    assert stats["STR"] == 10
-
-
-def test_get_race_human():
-    """Test race retrieval by name for Human."""
-    human = get_race("Human")
-    assert isinstance(human, Human)
-    assert human.name == "Human"
-
-
-def test_get_race_elf():
-    """Test race retrieval by name for Elf."""
-    elf = get_race("Elf")
-    assert isinstance(elf, Elf)
-    assert elf.name == "Elf"
+@pytest.mark.parametrize(
+    "race_name,deltas",
+    [
+        ("Human", {"STR": 1, "DEX": 1, "CON": 1, "INT": 1, "WIS": 1, "CHA": 1}),
+        ("Elf", {"DEX": 2}),
+        ("Dwarf", {"CON": 2}),
+        ("Halfling", {"DEX": 2, "CHA": 1}),
+    ],
+)
+def test_race_bonuses(race_name, deltas):
+    """Test each race raises exactly its bonus stats."""
+    stats = fresh_stats()
+    AVAILABLE_RACES[race_name].apply_bonuses(stats)
 
+    for stat, value in stats.items():
+        assert value == 10 + deltas.get(stat, 0)
 
-def test_get_race_dwarf():
-    """Test race retrieval by name for Dwarf."""
-    dwarf = get_race("Dwarf")
-    assert isinstance(dwarf, Dwarf)
-    assert dwarf.name == "Dwarf"
 
-
-def test_get_race_halfling():
-    """Test race retrieval by name for Halfling."""
-    halfling = get_race("Halfling")
-    assert isinstance(halfling, Halfling)
-    assert halfling.name == "Halfling"
+@pytest.mark.parametrize(
+    "race_name,race_cls",
+    [
+        ("Human", Human),
+        ("Elf", Elf),
+        ("Dwarf", Dwarf),
+        ("Halfling", Halfling),
+    ],
+)
+def test_get_race(race_name, race_cls):
+    """Test race retrieval by name."""
+    race = get_race(race_name)
+    assert isinstance(race, race_cls)
+    assert race.name == race_name
 
 
 def test_get_race_invalid():
@@ -127,11 +92,11 @@ def test_available_races_are_instances():
 
 def test_race_bonuses_dont_affect_others():
     """Test that applying bonuses to one stat dict doesn't affect others."""
-    human = Human()
-    elf = Elf()
+    human = AVAILABLE_RACES["Human"]
+    elf = AVAILABLE_RACES["Elf"]
 
-    stats1 = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    stats2 = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+    stats1 = fresh_stats()
+    stats2 = fresh_stats()
 
     human.apply_bonuses(stats1)
     elf.apply_bonuses(stats2)
@@ -143,3 +108,46 @@ def test_race_bonuses_dont_affect_others():
     # stats2 should only have +2 DEX
     assert stats2["STR"] == 10
     assert stats2["DEX"] == 12
+
+
+def test_race_bonuses_skip_missing_stats():
+    """Test bonuses only touch the stats that are present."""
+    stats = {"STR": 10}
+    AVAILABLE_RACES["Human"].apply_bonuses(stats)
+
+    assert stats == {"STR": 11}
+
+
+def test_custom_race_from_bonus_data():
+    """Test a new race only needs to declare its bonuses."""
+    orc = Race("Orc", "+2 STR, +1 CON", {"STR": 2, "CON": 1})
+    stats = fresh_stats()
+    orc.apply_bonuses(stats)
+
+    assert stats["STR"] == 12
+    assert stats["CON"] == 11
+    assert stats["DEX"] == 10
+
+
+def test_available_races_is_read_only():
+    """Test the race registry can't be modified at runtime."""
+    with pytest.raises(TypeError):
+        AVAILABLE_RACES["Orc"] = Race("Orc", "+2 STR", {"STR": 2})
+    assert get_race("Human") is AVAILABLE_RACES["Human"]
+
+
+def test_race_bonuses_are_read_only():
+    """Test a shared race's bonuses can't be changed by mistake."""
+    bonuses = {"STR": 2}
+    orc = Race("Orc", "+2 STR", bonuses)
+    bonuses["STR"] = 5  # The caller's dict is copied, not kept
+
+    with pytest.raises(TypeError):
+        AVAILABLE_RACES["Human"].bonuses["STR"] = 5
+    assert orc.bonuses["STR"] == 2
+    assert AVAILABLE_RACES["Human"].bonuses["STR"] == 1
+
+
+def test_deep_copied_character_shares_race(player):
+    """Test copying a character keeps the shared race instance."""
+    assert copy.deepcopy(player).race is player.race
@@ -1,11 +1,14 @@
 import pytest
-from unittest.mock import patch
-from dndgame.spells import (
-    DamageSpell, HealingSpell, SpellBook, SPELLS, get_spell
-)
-from dndgame.character import Character
-from dndgame.enemy import create_goblin
-from dndgame.races import Human
+from dndgame.spells import DamageSpell, HealingSpell, SpellBook, SPELLS, get_spell
+
+# Magic Missile's 3d4 all showing 2, plus a +3 INT modifier
+EXPECTED_MISSILE_DAMAGE = 3 * 2 + 3
+
+
+@pytest.fixture
+def magic_missile():
+    """Create the level 1 Magic Missile spell (3d4 force damage)."""
+    return DamageSpell("Magic Missile", 1, "Evocation", "Darts", 4, 3)
 
 
 def test_damage_spell_creation():
@@ -18,24 +21,17 @@ def test_damage_spell_creation():
     assert spell.damage_count == 8
 
 
-def test_damage_spell_cast():
+def test_damage_spell_cast(caster_int16, goblin, magic_missile, fixed_rolls):
     """Test casting a damage spell."""
-    human_race = Human()
-    caster = Character("Wizard", human_race, 10)
-    caster.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 16, "WIS": 10, "CHA": 10}
-    caster.hp = 10
-    caster.max_hp = 10
-    
-    target = create_goblin()
+    caster = caster_int16
+    target = goblin
     initial_hp = target.hp
-    
-    spell = DamageSpell("Magic Missile", 1, "Evocation", "Darts of force", 4, 3)
-    
-    with patch("dndgame.dice.random.randint", return_value=2):
-        result = spell.cast(caster, target)
-    
-    # 3d4 with all 2s = 6, +3 INT modifier = 9 damage
+
+    fixed_rolls(2)
+    result = magic_missile.cast(caster, target)
+
     assert target.hp < initial_hp
+    assert f"takes {EXPECTED_MISSILE_DAMAGE} damage" in result
     assert "Magic Missile" in result
 
 
@@ -47,91 +43,92 @@ def test_healing_spell_creation():
     assert spell.healing_count == 1
 
 
-def test_healing_spell_cast():
+def test_healing_spell_cast(caster_int14, fixed_rolls):
     """Test casting a healing spell."""
-    human_race = Human()
-    caster = Character("Cleric", human_race, 10)
-    caster.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 14, "WIS": 10, "CHA": 10}
-    caster.hp = 5
-    caster.max_hp = 10
-    
+    caster = caster_int14
+
     spell = HealingSpell("Cure Wounds", 1, "Evocation", "Heal", 8, 1)
-    
-    with patch("dndgame.dice.random.randint", return_value=5):
-        result = spell.cast(caster, caster)
-    
+
+    fixed_rolls(5)
+    result = spell.cast(caster, caster)
+
     # 1d8 = 5, +2 INT modifier = 7 healing
     assert caster.hp > 5
     assert "Cure Wounds" in result
 
 
-def test_healing_doesnt_exceed_max():
+def test_healing_doesnt_exceed_max(caster_int14, fixed_rolls):
     """Test that healing doesn't exceed max HP."""
-    human_race = Human()
-    target = Character("Cleric", human_race, 10)
-    target.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+    target = caster_int14
     target.hp = 9
-    target.max_hp = 10
-    
+
     spell = HealingSpell("Cure Wounds", 1, "Evocation", "Heal", 8, 1)
-    
-    with patch("dndgame.dice.random.randint", return_value=8):
-        spell.cast(target, target)
-    
+
+    fixed_rolls(8)
+    spell.cast(target, target)
+
     assert target.hp == 10  # Should not exceed max
 
 
 def test_spellbook_creation():
     """Test spellbook initialization."""
     spellbook = SpellBook()
-    assert isinstance(spellbook.spells, list)
-    assert len(spellbook.spells) == 0
+    assert spellbook.spells == ()
 
 
-def test_add_spell():
+def test_add_spell(magic_missile):
     """Test adding spells to spellbook."""
     spellbook = SpellBook()
-    spell = DamageSpell("Magic Missile", 1, "Evocation", "Darts", 4, 3)
 
-    spellbook.add_spell(spell)
-    assert len(spellbook.spells) == 1
-    assert spellbook.spells[0] == spell
+    spellbook.add_spell(magic_missile)
+    assert spellbook.spells == (magic_missile,)
 
 
-def test_add_duplicate_spell():
+def test_add_duplicate_spell(magic_missile):
     """Test that duplicate spells aren't added."""
     spellbook = SpellBook()
-    spell = DamageSpell("Magic Missile", 1, "Evocation", "Darts", 4, 3)
 
-    spellbook.add_spell(spell)
-    spellbook.add_spell(spell)
+    spellbook.add_spell(magic_missile)
+    spellbook.add_spell(magic_missile)
     assert len(spellbook.spells) == 1
 
 
-def test_get_spells_by_level():
+def test_spellbook_spells_are_read_only(magic_missile):
+    """Test the spell list can't be changed behind add_spell's back."""
+    spellbook = SpellBook()
+    spellbook.add_spell(magic_missile)
+
+    with pytest.raises(AttributeError):
+        spellbook.spells.append(magic_missile)
+    with pytest.raises(AttributeError):
+        spellbook.spells = []
+    assert spellbook.get_spells_by_level(1) == [magic_missile]
+
+
+def test_get_spells_by_level(magic_missile):
     """Test filtering spells by exact level."""
     spellbook = SpellBook()
-    
+
     spell1 = DamageSpell("Fire Bolt", 0, "Evocation", "Fire", 10, 1)
-    spell2 = DamageSpell("Magic Missile", 1, "Evocation", "Darts", 4, 3)
+    spell2 = magic_missile
     spell3 = DamageSpell("Fireball", 3, "Evocation", "Fire", 6, 8)
-    
+
     spellbook.add_spell(spell1)
     spellbook.add_spell(spell2)
     spellbook.add_spell(spell3)
-    
+
     level_1_spells = spellbook.get_spells_by_level(1)
     assert len(level_1_spells) == 1
     assert level_1_spells[0] == spell2
 
 
-def test_get_available_spells():
+def test_get_available_spells(magic_missile):
     """Test filtering spells by level."""
     spellbook = SpellBook()
 
     spells = [
         DamageSpell("Fire Bolt", 0, "Evocation", "Fire", 10, 1),
-        DamageSpell("Magic Missile", 1, "Evocation", "Darts", 4, 3),
+        magic_missile,
         HealingSpell("Cure Wounds", 1, "Evocation", "Heal", 8, 1),
         DamageSpell("Fireball", 3, "Evocation", "Fire", 6, 8),
     ]
@@ -144,15 +141,40 @@ def test_get_available_spells():
     assert all(spell.level <= 1 for spell in level_1_spells)
 
 
-def test_spells_catalog():
+def test_spellbook_keeps_spells_sorted_by_level(magic_missile):
+    """Test spells are ordered by level regardless of learning order."""
+    spellbook = SpellBook()
+
+    fireball = DamageSpell("Fireball", 3, "Evocation", "Fire", 6, 8)
+    missile = magic_missile
+    fire_bolt = DamageSpell("Fire Bolt", 0, "Evocation", "Fire", 10, 1)
+    cure = HealingSpell("Cure Wounds", 1, "Evocation", "Heal", 8, 1)
+
+    for spell in [fireball, missile, fire_bolt, cure]:
+        spellbook.add_spell(spell)
+
+    assert spellbook.spells == (fire_bolt, missile, cure, fireball)
+    assert spellbook.get_available_spells(0) == [fire_bolt]
+    assert spellbook.get_available_spells(2) == [fire_bolt, missile, cure]
+    assert spellbook.get_available_spells(-1) == []
+    assert spellbook.get_spells_by_level(1) == [missile, cure]
+    assert spellbook.get_spells_by_level(2) == []
+
+
+@pytest.mark.parametrize("name", ["Fire Bolt", "Magic Missile", "Cure Wounds"])
+def test_spells_catalog(name):
     """Test that spell catalog contains spells."""
-    assert "Fire Bolt" in SPELLS
-    assert "Magic Missile" in SPELLS
-    assert "Cure Wounds" in SPELLS
+    assert name in SPELLS
 
 
 def test_get_spell():
     """Test retrieving spell from catalog."""
     spell = get_spell("Fire Bolt")
     assert spell.name == "Fire Bolt"
-    assert spell.level == 0
\ No newline at end of file
+    assert spell.level == 0
+
+
+def test_spell_kind_tags():
+    """Test spells are tagged with what they do."""
+    assert get_spell("Fire Bolt").spell_kind == "damage"
+    assert get_spell("Cure Wounds").spell_kind == "heal"
@@ -1,5 +1,11 @@
 import pytest
-from dndgame.weapons import Weapon, WEAPONS, get_weapon, get_starting_weapon_for_race
+from dndgame.weapons import (
+    Weapon,
+    WeaponProperty,
+    WEAPONS,
+    get_weapon,
+    get_starting_weapon_for_race,
+)
 
 
 def test_weapon_creation():
@@ -9,7 +15,7 @@ def test_weapon_creation():
     assert weapon.damage_dice == 8
     assert weapon.damage_count == 1
     assert weapon.damage_bonus == 0
-    assert weapon.properties == {}
+    assert weapon.properties == WeaponProperty(0)
 
 
 def test_weapon_with_bonus():
@@ -22,18 +28,33 @@ def test_weapon_get_damage_description():
     """Test damage description generation."""
     weapon1 = Weapon("Dagger", 4, 1)
     assert weapon1.get_damage_description() == "1d4"
-    
+
     weapon2 = Weapon("Greatsword", 6, 2)
     assert weapon2.get_damage_description() == "2d6"
-    
+
     weapon3 = Weapon("Magic Sword", 8, 1, damage_bonus=2)
     assert weapon3.get_damage_description() == "1d8+2"
 
 
 def test_weapon_properties():
     """Test weapon with properties."""
-    weapon = Weapon("Rapier", 8, 1, properties={"finesse": True})
-    assert weapon.properties["finesse"] is True
+    weapon = Weapon("Rapier", 8, 1, properties=WeaponProperty.FINESSE)
+    assert weapon.properties & WeaponProperty.FINESSE
+    assert not weapon.properties & WeaponProperty.TWO_HANDED
+
+
+def test_catalog_weapon_property_flags():
+    """Test catalog weapons combine several property flags."""
+    greatsword = get_weapon("Greatsword")
+    assert greatsword.properties == WeaponProperty.TWO_HANDED | WeaponProperty.HEAVY
+
+
+def test_weapon_is_immutable():
+    """Test catalog weapons can't be modified in place."""
+    weapon = get_weapon("Longsword")
+    with pytest.raises(AttributeError):
+        weapon.damage_bonus = 5
+    assert weapon.get_damage_description() == "1d8"
 
 
 def test_get_weapon():
@@ -49,30 +70,27 @@ def test_get_weapon_invalid():
         get_weapon("LaserGun")
 
 
-def test_weapons_catalog():
+@pytest.mark.parametrize("name", ["Dagger", "Longsword", "Greatsword", "Shortsword"])
+def test_weapons_catalog(name):
     """Test weapons catalog contains expected weapons."""
-    assert "Dagger" in WEAPONS
-    assert "Longsword" in WEAPONS
-    assert "Greatsword" in WEAPONS
-    assert "Shortsword" in WEAPONS
-
-
-def test_get_starting_weapon_for_race():
+    assert name in WEAPONS
+
+
+@pytest.mark.parametrize(
+    "race_name,weapon_name",
+    [
+        ("Human", "Longsword"),
+        ("Elf", "Shortsword"),
+        ("Dwarf", "Battleaxe"),
+        ("Halfling", "Dagger"),
+    ],
+)
+def test_get_starting_weapon_for_race(race_name, weapon_name):
     """Test race-specific starting weapons."""
-    human_weapon = get_starting_weapon_for_race("Human")
-    assert human_weapon.name == "Longsword"
-    
-    elf_weapon = get_starting_weapon_for_race("Elf")
-    assert elf_weapon.name == "Shortsword"
-    
-    dwarf_weapon = get_starting_weapon_for_race("Dwarf")
-    assert dwarf_weapon.name == "Battleaxe"
-    
-    halfling_weapon = get_starting_weapon_for_race("Halfling")
-    assert halfling_weapon.name == "Dagger"
+    assert get_starting_weapon_for_race(race_name).name == weapon_name
 
 
 def test_get_starting_weapon_unknown_race():
     """Test unknown race gets unarmed strike."""
     weapon = get_starting_weapon_for_race("Dragon")
-    assert weapon.name == "Unarmed Strike"
\ No newline at end of file
+    assert weapon.name == "Unarmed Strike"